@@ -14,7 +14,38 @@ _gl_complete() {
     
     # First level command
     if [[ $cword -eq 1 ]]; then
-        COMPREPLY=($(compgen -W "$commands" -- "$cur"))
+        if [[ "$cur" == -* ]]; then
+            COMPREPLY=($(compgen -W "--help --verbose --version" -- "$cur"))
+        else
+            COMPREPLY=($(compgen -W "$commands" -- "$cur"))
+        fi
+        return
+    fi
+
+    # Handle flags (before the per-area blocks, which return early)
+    case "$prev" in
+        --format)
+            COMPREPLY=($(compgen -W "friendly table json" -- "$cur"))
+            return
+            ;;
+        --state)
+            COMPREPLY=($(compgen -W "opened merged closed all" -- "$cur"))
+            return
+            ;;
+        --status)
+            COMPREPLY=($(compgen -W "success failed running pending canceled skipped manual created" -- "$cur"))
+            return
+            ;;
+        --source)
+            COMPREPLY=($(compgen -W "push web trigger schedule api external pipeline chat merge_request_event" -- "$cur"))
+            return
+            ;;
+    esac
+
+    # Generic flag completion
+    if [[ "$cur" == -* ]]; then
+        local flags="--help --verbose --format --limit --state --status --source --open --create-mr --follow --latest --push --passed --failed --no-cache --last-kb --failures"
+        COMPREPLY=($(compgen -W "$flags" -- "$cur"))
         return
     fi
 
@@ -73,33 +104,6 @@ _gl_complete() {
         fi
         return
     fi
-
-    # Handle flags
-    case "$prev" in
-        --format)
-            COMPREPLY=($(compgen -W "friendly table json" -- "$cur"))
-            return
-            ;;
-        --state)
-            COMPREPLY=($(compgen -W "opened merged closed all" -- "$cur"))
-            return
-            ;;
-        --status)
-            COMPREPLY=($(compgen -W "success failed running pending canceled skipped manual created" -- "$cur"))
-            return
-            ;;
-        --source)
-            COMPREPLY=($(compgen -W "push web trigger schedule api external pipeline chat merge_request_event" -- "$cur"))
-            return
-            ;;
-    esac
-
-    # Generic flag completion
-    if [[ "$cur" == -* ]]; then
-        local flags="--help --verbose --format --limit --state --status --source --open --create-mr --follow --latest --push --passed --failed"
-        COMPREPLY=($(compgen -W "$flags" -- "$cur"))
-        return
-    fi
 }
 
 # Register the completion function
@@ -6,16 +6,65 @@
 import sys
 import argparse
 import gitlab
+from gitlab.v4.objects import (
+    ProjectBranch,
+    ProjectJob,
+    ProjectMergeRequest,
+    ProjectPipeline,
+)
 import sqlite3
 import json
+import time
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, List, Dict, Any
 import re
 
 from .config import Config
+from .commands.base import MR_STATE_COLORS, STATUS_DEFAULT, STATUS_TABLE
 
 COMPLETE_STATUSES = {"success", "failed", "canceled", "skipped"}
 
+# Seconds a cached job/MR GET response stays fresh
+RESPONSE_CACHE_TTL = 5
+
+# Seconds cached branch lookups and branch MR/pipeline listings stay fresh
+BRANCH_CACHE_TTL = 30
+
+# Trace patterns used by the failure extractors, compiled once at import
+PYTEST_SUMMARY_RE = re.compile(
+    r"(^=+\s*short test summary info\s*=+\n.*?)(?=^=+|\Z)",
+    re.MULTILINE | re.DOTALL | re.IGNORECASE,
+)
+PYTEST_FAILURES_RE = re.compile(
+    r"(^=+\s*FAILURES\s*=+\n.*?)(?=^[-=]+\s*Captured stderr call\s*[-=]+|\Z)",
+    re.MULTILINE | re.DOTALL,
+)
+PYTEST_STDERR_RE = re.compile(
+    r"(?:^-{5,}\s*Captured stderr call\s*-{5,}\n)(.*?)(?=^=+|\Z)",
+    re.MULTILINE | re.DOTALL,
+)
+PYLINT_MODULE_RE = re.compile(r"^\*+\s*Module\s+(.+)$", re.MULTILINE)
+# Pylint violation format: file.py:line:col: CODE: message
+PYLINT_VIOLATION_RE = re.compile(r"^.+\.py:\d+:\d+:\s+[A-Z]\d+:")
+JOB_EXIT_CODE_RE = re.compile(
+    r"ERROR: Job failed: command terminated with exit code (\d+)"
+)
+# Ruff format: file.py:line:col: CODE message
+RUFF_ERROR_RE = re.compile(
+    r"^(.+\.py):(\d+):(\d+):\s+([A-Z]\d+)\s+(.+)$", re.MULTILINE
+)
+# Mypy format: file.py:line: error: message
+MYPY_ERROR_RE = re.compile(r"^(.+\.py):(\d+):\s+error:\s+(.+)$", re.MULTILINE)
+
+
+@lru_cache(maxsize=1024)
+def _format_duration(duration: Optional[float]) -> str:
+    if duration is None:
+        return "N/A"
+    minutes, seconds = divmod(duration, 60)
+    return f"{int(minutes)}m{int(seconds)}s"
+
 
 class GitLabExplorer:
     def __init__(self, config: Config):
@@ -24,6 +73,8 @@ class GitLabExplorer:
         self.project = self.gl.projects.get(config.project_path)
         self.db_file = config.get_cache_path("pipelines_cache.db")
         self.init_db()
+        # MR pipeline listings already fetched in this process, by MR ID
+        self._mr_pipelines = {}
 
     def init_db(self):
         conn = sqlite3.connect(self.db_file)
@@ -47,66 +98,95 @@ class GitLabExplorer:
             )
             """
         )
+        cur.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                resource TEXT,
+                object_id TEXT,
+                fetched_at REAL,
+                data TEXT,
+                PRIMARY KEY (resource, object_id)
+            )
+            """
+        )
         conn.commit()
         conn.close()
 
     def get_mrs_for_branch(
-        self, branch_name: str, state: str = "opened"
+        self, branch_name: str, state: str = "opened", use_cache: bool = False
     ) -> List[Dict[str, Any]]:
         """Get all merge requests for a given branch."""
         try:
-            mrs = self.project.mergerequests.list(
-                source_branch=branch_name,
-                state=state,
-                order_by="created_at",
-                sort="desc",
-                all=True,
+            return self.cached_response(
+                "branch_mrs",
+                f"{branch_name}:{state}",
+                lambda: self._list_mrs_for_branch(branch_name, state),
+                BRANCH_CACHE_TTL,
+                use_cache,
             )
+        except Exception as e:
+            print(f"Error fetching MRs for branch {branch_name}: {e}")
+            return []
 
-            results = []
-            for mr in mrs:
-                mr_data = {
-                    "id": mr.id,
-                    "iid": mr.iid,
-                    "title": mr.title,
-                    "state": mr.state,
-                    "author": mr.author["username"],
-                    "target_branch": mr.target_branch,
-                    "created_at": mr.created_at,
-                    "updated_at": mr.updated_at,
-                    "web_url": mr.web_url,
-                    "has_conflicts": (
-                        mr.has_conflicts if hasattr(mr, "has_conflicts") else None
-                    ),
-                    "merge_status": (
-                        mr.merge_status if hasattr(mr, "merge_status") else None
-                    ),
-                }
+    def _list_mrs_for_branch(
+        self, branch_name: str, state: str
+    ) -> List[Dict[str, Any]]:
+        """Fetch a branch's MRs from the API as plain dicts"""
+        mrs = self.project.mergerequests.list(
+            source_branch=branch_name,
+            state=state,
+            order_by="created_at",
+            sort="desc",
+            all=True,
+        )
 
-                if hasattr(mr, "head_pipeline") and mr.head_pipeline:
-                    mr_data["pipeline_status"] = mr.head_pipeline.get(
-                        "status", "unknown"
-                    )
-                    mr_data["pipeline_id"] = mr.head_pipeline.get("id")
-                else:
-                    mr_data["pipeline_status"] = None
-                    mr_data["pipeline_id"] = None
+        results = []
+        for mr in mrs:
+            mr_data = {
+                "id": mr.id,
+                "iid": mr.iid,
+                "title": mr.title,
+                "state": mr.state,
+                "author": mr.author["username"],
+                "target_branch": mr.target_branch,
+                "created_at": mr.created_at,
+                "updated_at": mr.updated_at,
+                "web_url": mr.web_url,
+                "has_conflicts": (
+                    mr.has_conflicts if hasattr(mr, "has_conflicts") else None
+                ),
+                "merge_status": (
+                    mr.merge_status if hasattr(mr, "merge_status") else None
+                ),
+            }
 
-                results.append(mr_data)
+            head_pipeline = getattr(mr, "head_pipeline", None)
+            if head_pipeline:
+                mr_data["pipeline_status"] = head_pipeline.get("status", "unknown")
+                mr_data["pipeline_id"] = head_pipeline.get("id")
+            else:
+                mr_data["pipeline_status"] = None
+                mr_data["pipeline_id"] = None
 
-            return results
-        except Exception as e:
-            print(f"Error fetching MRs for branch {branch_name}: {e}")
-            return []
+            results.append(mr_data)
+
+        return results
 
-    def get_pipelines_for_mr(self, mr_id: int) -> List[Dict[str, Any]]:
+    def get_pipelines_for_mr(
+        self, mr_id: int, mr=None, quiet: bool = False
+    ) -> List[Dict[str, Any]]:
         """Get all pipelines for a given merge request."""
+        if mr_id in self._mr_pipelines:
+            return self._mr_pipelines[mr_id]
         try:
-            mr = self.project.mergerequests.get(mr_id)
-            pipelines = mr.pipelines()
+            if mr is None:
+                # Listing pipelines only needs the MR path, not its attributes
+                mr = self.project.mergerequests.get(mr_id, lazy=True)
+            pipelines = mr.pipelines.list(all=True)
 
             results = []
-            for pipeline in pipelines:
+            for item in pipelines:
+                pipeline = item.attributes
                 pipeline_data = {
                     "id": pipeline["id"],
                     "status": pipeline["status"],
@@ -118,13 +198,19 @@ class GitLabExplorer:
                 results.append(pipeline_data)
 
             results.sort(key=lambda x: x["created_at"], reverse=True)
+            self._mr_pipelines[mr_id] = results
             return results
         except Exception as e:
-            print(f"Error fetching pipelines for MR {mr_id}: {e}")
+            if not quiet:
+                print(f"Error fetching pipelines for MR {mr_id}: {e}")
             return []
 
     def get_pipeline_details(
-        self, pipeline_id: int, use_cache: bool = True, verbose: bool = False
+        self,
+        pipeline_id: int,
+        use_cache: bool = True,
+        verbose: bool = False,
+        quiet: bool = False,
     ) -> Optional[Dict[str, Any]]:
         """Get detailed information about a pipeline."""
         # Cache lookup speeds up repeated requests
@@ -170,7 +256,8 @@ class GitLabExplorer:
 
             return data
         except Exception as e:
-            print(f"Error fetching pipeline {pipeline_id}: {e}")
+            if not quiet:
+                print(f"Error fetching pipeline {pipeline_id}: {e}")
             return None
 
     def get_pipeline_from_cache(
@@ -215,11 +302,133 @@ class GitLabExplorer:
         conn.commit()
         conn.close()
 
+    def cached_response(
+        self,
+        resource: str,
+        key,
+        loader,
+        ttl: float = RESPONSE_CACHE_TTL,
+        use_cache: bool = True,
+    ):
+        """Return loader()'s JSON-serializable result, reusing one younger than ttl"""
+        if not use_cache:
+            return loader()
+        key = self._response_key(key)
+        conn = sqlite3.connect(self.db_file)
+        cur = conn.cursor()
+        cur.execute(
+            "SELECT data FROM responses WHERE resource = ? AND object_id = ? AND fetched_at > ?",
+            (resource, key, time.time() - ttl),
+        )
+        row = cur.fetchone()
+        conn.close()
+        if row:
+            return json.loads(row[0])
+
+        data = loader()
+        now = time.time()
+        conn = sqlite3.connect(self.db_file)
+        # Each resource is read with one TTL, so its older rows are dead
+        conn.execute(
+            "DELETE FROM responses WHERE resource = ? AND fetched_at <= ?",
+            (resource, now - ttl),
+        )
+        conn.execute(
+            "REPLACE INTO responses (resource, object_id, fetched_at, data) VALUES (?, ?, ?, ?)",
+            (resource, key, now, json.dumps(data)),
+        )
+        conn.commit()
+        conn.close()
+        return data
+
+    def _response_key(self, key) -> str:
+        """Scope a cache key to the project; the cache file is shared"""
+        return f"{self.project.id}:{key}"
+
+    def _get_cached_object(
+        self,
+        resource: str,
+        manager,
+        obj_cls,
+        object_id,
+        use_cache: bool,
+        ttl: float = RESPONSE_CACHE_TTL,
+    ):
+        """GET an object through manager via cached_response"""
+        data = self.cached_response(
+            resource,
+            object_id,
+            lambda: manager.get(object_id).attributes,
+            ttl,
+            use_cache,
+        )
+        return obj_cls(manager, data)
+
+    def get_job(self, job_id, use_cache: bool = True):
+        """Get a project job, briefly cached between runs"""
+        return self._get_cached_object(
+            "job", self.project.jobs, ProjectJob, job_id, use_cache
+        )
+
+    def get_merge_request(self, mr_id, use_cache: bool = True):
+        """Get a project merge request, briefly cached between runs"""
+        return self._get_cached_object(
+            "mr", self.project.mergerequests, ProjectMergeRequest, mr_id, use_cache
+        )
+
+    def get_branch(self, branch_name: str, use_cache: bool = False):
+        """Get a repository branch, optionally cached between runs"""
+        return self._get_cached_object(
+            "branch",
+            self.project.branches,
+            ProjectBranch,
+            branch_name,
+            use_cache,
+            BRANCH_CACHE_TTL,
+        )
+
+    def get_latest_pipeline(self, ref: str, use_cache: bool = False):
+        """Return (pipeline count, latest pipeline) for a ref from a one-item page"""
+        manager = self.project.pipelines
+
+        def load():
+            # The count comes from X-Total, which GitLab omits past 10,000 rows
+            page = manager.list(ref=ref, per_page=1, iterator=True)
+            latest = next(page, None)
+            return [page.total, latest.attributes if latest else None]
+
+        total, latest = self.cached_response(
+            "ref_latest_pipeline", ref, load, BRANCH_CACHE_TTL, use_cache
+        )
+        return total, ProjectPipeline(manager, latest) if latest else None
+
+    def list_pipelines(self, use_cache: bool = False, **params):
+        """List one page of project pipelines, optionally cached between runs"""
+        manager = self.project.pipelines
+        rows = self.cached_response(
+            "pipeline_list",
+            json.dumps(params, sort_keys=True),
+            lambda: [p.attributes for p in manager.list(get_all=False, **params)],
+            BRANCH_CACHE_TTL,
+            use_cache,
+        )
+        return [ProjectPipeline(manager, row) for row in rows]
+
+    def invalidate_response(self, resource: str, object_id):
+        """Drop a cached GET response, e.g. after the object was changed"""
+        conn = sqlite3.connect(self.db_file)
+        conn.execute(
+            "DELETE FROM responses WHERE resource = ? AND object_id = ?",
+            (resource, self._response_key(object_id)),
+        )
+        conn.commit()
+        conn.close()
+
     def get_job_status_summary(
-        self, pipeline_id: int, verbose: bool = False
+        self, pipeline_id: int, verbose: bool = False, quiet: bool = False
     ) -> Dict[str, Any]:
         """Get a summary of job statuses for a pipeline."""
-        data = self.get_pipeline_details(pipeline_id, verbose=verbose)
+        data = self.get_pipeline_details(pipeline_id, verbose=verbose, quiet=quiet)
         if not data:
             return {}
 
@@ -369,27 +578,15 @@ class GitLabExplorer:
 
     def extract_pytest_failures(self, trace: str, failures: Dict) -> Dict[str, Any]:
         """Extract pytest-specific failure information."""
-        summary_pattern = re.compile(
-            r"(^=+\s*short test summary info\s*=+\n.*?)(?=^=+|\Z)",
-            re.MULTILINE | re.DOTALL | re.IGNORECASE,
-        )
-        summary_match = summary_pattern.search(trace)
+        summary_match = PYTEST_SUMMARY_RE.search(trace)
         if summary_match:
             failures["short_summary"] = summary_match.group(1).strip()
 
-        failures_pattern = re.compile(
-            r"(^=+\s*FAILURES\s*=+\n.*?)(?=^[-=]+\s*Captured stderr call\s*[-=]+|\Z)",
-            re.MULTILINE | re.DOTALL,
-        )
-        failures_match = failures_pattern.search(trace)
+        failures_match = PYTEST_FAILURES_RE.search(trace)
         if failures_match:
             failures["detailed_failures"] = failures_match.group(1).strip()
 
-        stderr_pattern = re.compile(
-            r"(?:^-{5,}\s*Captured stderr call\s*-{5,}\n)(.*?)(?=^=+|\Z)",
-            re.MULTILINE | re.DOTALL,
-        )
-        stderr_match = stderr_pattern.search(trace)
+        stderr_match = PYTEST_STDERR_RE.search(trace)
         if stderr_match:
             failures["stderr"] = stderr_match.group(1).strip()
 
@@ -398,23 +595,20 @@ class GitLabExplorer:
     def extract_pylint_failures(self, trace: str, failures: Dict) -> Dict[str, Any]:
         """Extract pylint-specific violations."""
         violations = []
-        violation_pattern = re.compile(r"^\*+\s*Module\s+(.+)$", re.MULTILINE)
-
-        module_matches = violation_pattern.finditer(trace)
+        module_matches = PYLINT_MODULE_RE.finditer(trace)
 
         for match in module_matches:
             module_name = match.group(1)
             module_start = match.end()
 
-            next_module = violation_pattern.search(trace, module_start)
+            next_module = PYLINT_MODULE_RE.search(trace, module_start)
             module_end = next_module.start() if next_module else len(trace)
 
             module_section = trace[module_start:module_end]
             violation_lines = []
 
             for line in module_section.split("\n"):
-                # Match pylint violation format: file.py:line:col: CODE: message
-                if re.match(r"^.+\.py:\d+:\d+:\s+[A-Z]\d+:", line):
+                if PYLINT_VIOLATION_RE.match(line):
                     violation_lines.append(line.strip())
 
             if violation_lines:
@@ -430,10 +624,7 @@ class GitLabExplorer:
                     "short_summary"
                 ] += f"\n... and {len(violations) - 20} more violations"
 
-        exit_pattern = re.compile(
-            r"ERROR: Job failed: command terminated with exit code (\d+)"
-        )
-        exit_match = exit_pattern.search(trace)
+        exit_match = JOB_EXIT_CODE_RE.search(trace)
         if exit_match and not violations:
             failures["short_summary"] = (
                 f"Pylint failed with exit code {exit_match.group(1)}"
@@ -445,11 +636,7 @@ class GitLabExplorer:
         """Extract linting failures (ruff, flake8, etc)."""
         lint_errors = []
 
-        # Ruff format: file.py:line:col: CODE message
-        ruff_pattern = re.compile(
-            r"^(.+\.py):(\d+):(\d+):\s+([A-Z]\d+)\s+(.+)$", re.MULTILINE
-        )
-        for match in ruff_pattern.finditer(trace):
+        for match in RUFF_ERROR_RE.finditer(trace):
             lint_errors.append(match.group(0).strip())
 
         if lint_errors:
@@ -468,9 +655,7 @@ class GitLabExplorer:
         """Extract type checking failures (mypy, etc)."""
         type_errors = []
 
-        # Mypy format: file.py:line: error: message
-        mypy_pattern = re.compile(r"^(.+\.py):(\d+):\s+error:\s+(.+)$", re.MULTILINE)
-        for match in mypy_pattern.finditer(trace):
+        for match in MYPY_ERROR_RE.finditer(trace):
             type_errors.append(match.group(0).strip())
 
         if type_errors:
@@ -521,10 +706,9 @@ class GitLabExplorer:
 
     def format_duration(self, duration: Optional[float]) -> str:
         """Format duration in seconds to human-readable format."""
-        if duration is None:
-            return "N/A"
-        minutes, seconds = divmod(duration, 60)
-        return f"{int(minutes)}m{int(seconds)}s"
+        # Job tables repeat the same durations (None, whole seconds), so
+        # the formatting is memoized at module level
+        return _format_duration(duration)
 
 
 class PipelineCLI:
@@ -612,12 +796,9 @@ class PipelineCLI:
         try:
             mr = self.explorer.project.mergerequests.get(args.mr_id)
 
-            if mr.state == "opened":
-                state_display = f"\033[92m{mr.state.upper()}\033[0m"  # Green
-            elif mr.state == "merged":
-                state_display = f"\033[94m{mr.state.upper()}\033[0m"  # Blue
-            elif mr.state == "closed":
-                state_display = f"\033[91m{mr.state.upper()}\033[0m"  # Red
+            state_color = MR_STATE_COLORS.get(mr.state)
+            if state_color:
+                state_display = f"{state_color}{mr.state.upper()}\033[0m"
             else:
                 state_display = mr.state.upper()
 
@@ -651,18 +832,16 @@ class PipelineCLI:
                     print(f"Conflicts:     \033[91m⚠️  Has conflicts\033[0m")
 
             # Pipeline status
-            if hasattr(mr, "head_pipeline") and mr.head_pipeline:
-                pipeline_status = mr.head_pipeline.get("status", "unknown")
-                if pipeline_status == "success":
-                    pipeline_display = f"\033[92m✅ {pipeline_status}\033[0m"
-                elif pipeline_status == "failed":
-                    pipeline_display = f"\033[91m❌ {pipeline_status}\033[0m"
-                elif pipeline_status == "running":
-                    pipeline_display = f"\033[93m🔄 {pipeline_status}\033[0m"
+            head_pipeline = getattr(mr, "head_pipeline", None)
+            if head_pipeline:
+                pipeline_status = head_pipeline.get("status", "unknown")
+                icon, color, _ = STATUS_TABLE.get(pipeline_status, STATUS_DEFAULT)
+                if color:
+                    pipeline_display = f"{color}{icon} {pipeline_status}\033[0m"
                 else:
                     pipeline_display = pipeline_status
                 print(
-                    f"Pipeline:      {pipeline_display} (ID: {mr.head_pipeline.get('id')})"
+                    f"Pipeline:      {pipeline_display} (ID: {head_pipeline.get('id')})"
                 )
 
             # Approvals
@@ -691,7 +870,7 @@ class PipelineCLI:
                 print(f"\nDescription:")
                 print("-" * 40)
                 # Limit description to first 500 chars or 10 lines
-                desc_lines = mr.description.split("\n")[:10]
+                desc_lines = mr.description.split("\n", 10)[:10]
                 desc_text = "\n".join(desc_lines)
                 if len(desc_text) > 500:
                     desc_text = desc_text[:500] + "..."
@@ -726,12 +905,9 @@ class PipelineCLI:
 
             # Color-code status
             status = p["status"]
-            if status == "success":
-                status_display = f"\033[92m{status:<12}\033[0m"  # Green
-            elif status == "failed":
-                status_display = f"\033[91m{status:<12}\033[0m"  # Red
-            elif status == "running":
-                status_display = f"\033[93m{status:<12}\033[0m"  # Yellow
+            color = STATUS_TABLE.get(status, STATUS_DEFAULT)[1]
+            if color:
+                status_display = f"{color}{status:<12}\033[0m"
             else:
                 status_display = f"{status:<12}"
 
@@ -778,19 +954,12 @@ class PipelineCLI:
                 "failed_jobs": summary["failed_jobs"],
                 "stages": summary["stages"],
             }
-            print(json.dumps(output, indent=2))
+            print(json.dumps(output, indent=2 if sys.stdout.isatty() else None))
             return
 
         # Pipeline header with progress bar
         pipeline_status = summary["pipeline_status"]
-        if pipeline_status == "success":
-            status_icon = "✅"
-        elif pipeline_status == "failed":
-            status_icon = "❌"
-        elif pipeline_status == "running":
-            status_icon = "🔄"
-        else:
-            status_icon = "⏸"
+        status_icon = STATUS_TABLE.get(pipeline_status, STATUS_DEFAULT)[0]
 
         print(
             f"\n{status_icon} Pipeline {args.pipeline_id} - {pipeline_status.upper()}"
@@ -857,24 +1026,7 @@ class PipelineCLI:
                 # Show jobs in this stage
                 for job in sorted(jobs, key=lambda x: x["name"]):
                     status = job["status"].lower()
-                    if status == "success":
-                        job_icon = "✅"
-                        status_color = "\033[92m"
-                    elif status == "failed":
-                        job_icon = "❌"
-                        status_color = "\033[91m"
-                    elif status == "running":
-                        job_icon = "🔄"
-                        status_color = "\033[93m"
-                    elif status == "pending":
-                        job_icon = "⏸"
-                        status_color = "\033[90m"
-                    elif status == "skipped":
-                        job_icon = "⏭"
-                        status_color = "\033[90m"
-                    else:
-                        job_icon = "  "
-                        status_color = ""
+                    job_icon, status_color, _ = STATUS_TABLE.get(status, ("  ", "", ""))
 
                     duration = (
                         self.explorer.format_duration(job["duration"])
@@ -913,11 +1065,12 @@ class PipelineCLI:
                         f"{job['id']:<12} {job['stage']:<15} {job['name'][:40]:<40} {duration}"
                     )
 
-    def cmd_pipeline_jobs(self, args):
+    def cmd_pipeline_jobs(self, args, output_format=None, data=None):
         """List all jobs in a pipeline with optional filtering."""
-        data = self.explorer.get_pipeline_details(
-            args.pipeline_id, verbose=self.verbose
-        )
+        if data is None:
+            data = self.explorer.get_pipeline_details(
+                args.pipeline_id, verbose=self.verbose
+            )
 
         if not data:
             print(f"Could not fetch pipeline {args.pipeline_id}")
@@ -944,7 +1097,8 @@ class PipelineCLI:
         else:
             jobs.sort(key=lambda x: x.get("created_at", ""))
 
-        output_format = getattr(args, "format", self.default_format)
+        if output_format is None:
+            output_format = getattr(args, "format", None) or self.default_format
 
         if output_format == "json":
             import json
@@ -968,7 +1122,7 @@ class PipelineCLI:
                         "web_url": job.get("web_url", ""),
                     }
                 )
-            print(json.dumps(output, indent=2))
+            print(json.dumps(output, indent=2 if sys.stdout.isatty() else None))
 
         elif output_format == "table":
             print(
@@ -991,12 +1145,9 @@ class PipelineCLI:
 
             for job in jobs:
                 status = job.get("status", "unknown")
-                if status == "success":
-                    status_display = f"\033[92m{status:<10}\033[0m"
-                elif status == "failed":
-                    status_display = f"\033[91m{status:<10}\033[0m"
-                elif status == "running":
-                    status_display = f"\033[93m{status:<10}\033[0m"
+                color = STATUS_TABLE.get(status, STATUS_DEFAULT)[1]
+                if color:
+                    status_display = f"{color}{status:<10}\033[0m"
                 else:
                     status_display = f"{status:<10}"
 
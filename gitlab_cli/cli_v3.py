@@ -6,39 +6,187 @@
 import os
 import sys
 import argparse
-
-from .config import Config
-from .cli import PipelineCLI
-from .commands import (
-    BranchesCommand,
-    PipelineCommands,
-    JobCommands,
-    MRsCommand,
-    ConfigCommand,
-    CacheCommand,
-    BranchCommand,
-    CodeSearchCommand,
+from importlib import import_module
+
+from . import __version__
+from .commands.base import (
+    FORMAT_CHOICES,
+    MR_STATE_CHOICES,
+    DIFF_VIEW_CHOICES,
+    PIPELINE_STATUS_CHOICES,
+    PIPELINE_SOURCE_CHOICES,
 )
-from .commands.search import SearchCommand
-from .commands.mr_context import MRContextCommand
+
+
+def positive_int(value):
+    """argparse type for options that only make sense above zero"""
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
+# Command handler attribute -> (module in .commands, class), created on first use
+_COMMAND_CLASSES = {
+    "branches_cmd": ("branches", "BranchesCommand"),
+    "branch_cmd": ("branch_context", "BranchCommand"),
+    "pipelines_cmd": ("pipelines", "PipelineCommands"),
+    "jobs_cmd": ("jobs", "JobCommands"),
+    "mrs_cmd": ("mrs", "MRsCommand"),
+    "mr_context_cmd": ("mr_context", "MRContextCommand"),
+    "config_cmd": ("config", "ConfigCommand"),
+    "cache_cmd": ("cache", "CacheCommand"),
+    "search_cmd": ("search", "SearchCommand"),
+    "code_search_cmd": ("code_search", "CodeSearchCommand"),
+}
+
+# Area name (and alias) -> method that adds its parser; names, not bound
+# methods, so only the invoked area's command module gets imported
+_AREA_BUILDERS = {
+    "branch": "_add_branch_parser",
+    "mr": "_add_mr_parser",
+    "merge-request": "_add_mr_parser",
+    "pipeline": "_add_pipeline_parser",
+    "job": "_add_job_parser",
+    "search": "_add_search_parser",
+    "config": "_add_config_parser",
+    "cache": "_add_cache_parser",
+}
+
+# (area, action) -> (ID attribute on args, command attribute, handler method)
+_ACTION_TABLE = {
+    ("pipeline", "detail"): ("pipeline_id", "pipelines_cmd", "handle_pipeline_detail"),
+    ("pipeline", "graph"): ("pipeline_id", "pipelines_cmd", "handle_pipeline_graph"),
+    ("pipeline", "retry"): ("pipeline_id", "pipelines_cmd", "handle_pipeline_retry"),
+    ("pipeline", "rerun"): ("pipeline_id", "pipelines_cmd", "handle_pipeline_rerun"),
+    ("pipeline", "cancel"): ("pipeline_id", "pipelines_cmd", "handle_pipeline_cancel"),
+    ("job", "detail"): ("job_id", "jobs_cmd", "handle_job_detail"),
+    ("job", "logs"): ("job_id", "jobs_cmd", "handle_job_logs"),
+    ("job", "tail"): ("job_id", "jobs_cmd", "handle_job_tail"),
+    ("job", "retry"): ("job_id", "jobs_cmd", "handle_job_retry"),
+    ("job", "play"): ("job_id", "jobs_cmd", "handle_job_play"),
+}
+
+# Friendly top-level help, written in one call by print_main_help()
+MAIN_HELP = """\
+GitLab CLI - Explore pipelines, jobs, and merge requests
+
+Usage: gl <area> [resource] [options]
+
+Areas:
+  branch [name]        Show branch info and related resources
+  mr <id>              Show MR info and related resources
+  pipeline <id>        Show pipeline info and jobs
+  job <id>             Show job info and logs
+  config               Manage configuration
+  cache                Manage cache
+
+Contextual Commands:
+  gl branch                   # Show current branch info
+  gl branch pipeline          # Show pipelines for current branch
+  gl branch mr                # Show MRs for current branch
+  gl branch commits           # Show commits for current branch
+  gl branch <name>            # Show specific branch info
+  gl branch <name> pipeline   # Show pipelines for specific branch
+  gl branch --create-mr       # Create MR from current branch
+
+  gl mr <id>                  # Show MR info
+  gl mr <id> diff             # Show MR diff
+  gl mr <id> pipeline         # Show MR pipelines
+  gl mr <id> commit           # Show MR commits
+  gl mr <id> discussion       # Show MR discussions
+
+Actions:
+  gl pipeline list            # List/search pipelines
+  gl pipeline <id>            # Show pipeline summary
+  gl pipeline detail <id>     # Show comprehensive info
+  gl pipeline graph <id>      # Show pipeline graph
+  gl pipeline retry <id>      # Retry failed jobs
+  gl pipeline rerun <id>      # Create new pipeline for same commit
+  gl pipeline cancel <id>     # Cancel pipeline
+
+  gl job <id>                 # Show job summary
+  gl job detail <id>          # Show comprehensive info
+  gl job logs <id>            # Show job logs
+  gl job tail <id>            # Tail job logs
+  gl job retry <id>           # Retry job
+  gl job play <id>            # Play manual job
+
+  gl mr search                # Search MRs with filters
+
+  gl cache stats              # Show cache statistics
+  gl cache list               # List cached pipelines
+  gl cache clear              # Clear cache
+
+  gl search code <term> -g <group>  # Search code across group
+    rg -v exclude_pattern ~/.cache/gitlab-cli/last_search.txt
+
+Diff View Options:
+  gl mr <id> diff             # Default view (from config)
+  gl mr <id> diff --view split    # Side-by-side diff
+  gl mr <id> diff --view inline   # Inline diff with line numbers
+  gl mr <id> diff --view unified  # Traditional git diff
+  gl mr <id> diff --stats         # Show only statistics
+  gl mr <id> diff --name-only     # Show only file names
+
+Common options:
+  --format <type>      Output as friendly, table, or json
+  --help               Show help for any command
+  --version            Show the gl version
+"""
 
 
 class GitLabCLIv3:
     def __init__(self):
-        self.config = Config()
-        self.branches_cmd = BranchesCommand()
-        self.branch_cmd = BranchCommand()
-        self.pipelines_cmd = PipelineCommands()
-        self.jobs_cmd = JobCommands()
-        self.mrs_cmd = MRsCommand()
-        self.mr_context_cmd = MRContextCommand()
-        self.config_cmd = ConfigCommand()
-        self.cache_cmd = CacheCommand()
-        self.search_cmd = SearchCommand()
-        self.code_search_cmd = CodeSearchCommand()
-
-    def create_parser(self):
-        """Create the main argument parser with subcommands"""
+        self._config = None
+        self._validation = None
+        self._parsers = {}
+        self._cli = None
+
+    def __getattr__(self, name):
+        """Create command handlers on first use so unused modules stay unloaded"""
+        if name not in _COMMAND_CLASSES:
+            raise AttributeError(name)
+        module, class_name = _COMMAND_CLASSES[name]
+        module = import_module(f".commands.{module}", __package__)
+        handler = getattr(module, class_name)()
+        setattr(self, name, handler)
+        return handler
+
+    @property
+    def config(self):
+        """Configuration, loaded on first use so help output skips file I/O"""
+        if self._config is None:
+            from .config import Config
+
+            self._config = Config()
+        return self._config
+
+    def validate_config(self):
+        """Validate the configuration once per invocation"""
+        if self._validation is None:
+            self._validation = self.config.validate()
+        return self._validation
+
+    def _sniff_area(self, argv):
+        """Return the first positional token, which argparse treats as the area"""
+        for token in argv:
+            if not token.startswith("-"):
+                return token
+        return None
+
+    def create_parser(self, area=None):
+        """Create the main argument parser with subcommands
+
+        When ``area`` names a known area only that subparser is built; any
+        other value builds all of them so usage errors list every choice.
+        Parsers are memoized per instance for repeated programmatic use.
+        """
+        if area not in _AREA_BUILDERS:
+            area = None
+        if area in self._parsers:
+            return self._parsers[area]
+
         parser = argparse.ArgumentParser(
             prog="gl",
             description="GitLab CLI - Explore pipelines, jobs, and merge requests",
@@ -51,6 +199,12 @@ class GitLabCLIv3:
             action="store_true",
             help="Enable verbose output (shows caching, timing, etc.)",
         )
+        parser.add_argument(
+            "--version",
+            "-V",
+            action="version",
+            version=f"%(prog)s {__version__}",
+        )
 
         subparsers = parser.add_subparsers(
             dest="area",
@@ -59,14 +213,14 @@ class GitLabCLIv3:
             metavar="<area>",
         )
 
-        self._add_branch_parser(subparsers)
-        self._add_mr_parser(subparsers)
-        self._add_pipeline_parser(subparsers)
-        self._add_job_parser(subparsers)
-        self._add_search_parser(subparsers)
-        self.config_cmd.add_arguments(subparsers)
-        self.cache_cmd.add_arguments(subparsers)
+        if area:
+            getattr(self, _AREA_BUILDERS[area])(subparsers)
+        else:
+            # dict.fromkeys drops the alias entries, keeping area order
+            for builder in dict.fromkeys(_AREA_BUILDERS.values()):
+                getattr(self, builder)(subparsers)
 
+        self._parsers[area] = parser
         return parser
 
     def _add_branch_parser(self, subparsers):
@@ -110,7 +264,7 @@ class GitLabCLIv3:
 
         parser.add_argument(
             "--view",
-            choices=["inline", "split", "unified"],
+            choices=DIFF_VIEW_CHOICES,
             help="Diff view mode (inline, split, unified)",
         )
         parser.add_argument(
@@ -135,7 +289,7 @@ class GitLabCLIv3:
         parser.add_argument("--reviewer", help="Filter by reviewer username")
         parser.add_argument(
             "--state",
-            choices=["opened", "closed", "merged", "all"],
+            choices=MR_STATE_CHOICES,
             default="opened",
             help="Filter by MR state (default: opened)",
         )
@@ -167,8 +321,11 @@ class GitLabCLIv3:
             help="Maximum number of items to show (default: 20)",
         )
         parser.add_argument(
-            "--format", choices=["friendly", "table", "json"], help="Output format"
+            "--no-cache",
+            action="store_true",
+            help="Bypass the short-lived response cache",
         )
+        parser.add_argument("--format", choices=FORMAT_CHOICES, help="Output format")
 
     def _add_pipeline_parser(self, subparsers):
         """Add pipeline command parser"""
@@ -186,6 +343,7 @@ class GitLabCLIv3:
         parser.add_argument(
             "pipeline_id",
             nargs="?",
+            type=int,
             help='Pipeline ID (when using "detail", "graph", "retry", "rerun", or "cancel")',
         )
 
@@ -215,9 +373,7 @@ class GitLabCLIv3:
             action="store_true",
             help="Show pipeline variables (for detail command)",
         )
-        parser.add_argument(
-            "--format", choices=["friendly", "table", "json"], help="Output format"
-        )
+        parser.add_argument("--format", choices=FORMAT_CHOICES, help="Output format")
         parser.add_argument(
             "--verbose", "-v", action="store_true", help="Enable verbose output"
         )
@@ -236,17 +392,7 @@ class GitLabCLIv3:
         parser.add_argument("--ref", help="(list) Filter by ref/branch name")
         parser.add_argument(
             "--source",
-            choices=[
-                "push",
-                "web",
-                "trigger",
-                "schedule",
-                "api",
-                "external",
-                "pipeline",
-                "chat",
-                "merge_request_event",
-            ],
+            choices=PIPELINE_SOURCE_CHOICES,
             help="(list) Filter by pipeline source",
         )
         parser.add_argument(
@@ -256,16 +402,7 @@ class GitLabCLIv3:
         )
         parser.add_argument(
             "--status",
-            choices=[
-                "success",
-                "failed",
-                "running",
-                "pending",
-                "canceled",
-                "skipped",
-                "manual",
-                "created",
-            ],
+            choices=PIPELINE_STATUS_CHOICES,
             help="(list) Filter by pipeline status",
         )
         parser.add_argument(
@@ -296,14 +433,32 @@ class GitLabCLIv3:
         parser.add_argument(
             "job_id",
             nargs="?",
+            type=int,
             help='Job ID (when using "detail", "logs", "tail", "retry", or "play")',
         )
         parser.add_argument(
             "--failures", action="store_true", help="Show detailed failure information"
         )
         parser.add_argument(
-            "--format", choices=["friendly", "table", "json"], help="Output format"
+            "--last-kb",
+            type=positive_int,
+            metavar="KB",
+            help="Only show the last KB kilobytes of the log (for logs command)",
         )
+        parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            help="Bypass the short-lived response cache (tail always reads live)",
+        )
+        parser.add_argument("--format", choices=FORMAT_CHOICES, help="Output format")
+
+    def _add_config_parser(self, subparsers):
+        """Add config command parser"""
+        self.config_cmd.add_arguments(subparsers)
+
+    def _add_cache_parser(self, subparsers):
+        """Add cache command parser"""
+        self.cache_cmd.add_arguments(subparsers)
 
     def _add_search_parser(self, subparsers):
         parser = subparsers.add_parser(
@@ -334,61 +489,14 @@ class GitLabCLIv3:
 
     def print_main_help(self):
         """Print friendly main help"""
-        print("GitLab CLI - Explore pipelines, jobs, and merge requests\n")
-        print("Usage: gl <area> [resource] [options]\n")
-        print("Areas:")
-        print("  branch [name]        Show branch info and related resources")
-        print("  mr <id>              Show MR info and related resources")
-        print("  pipeline <id>        Show pipeline info and jobs")
-        print("  job <id>             Show job info and logs")
-        print("  config               Manage configuration")
-        print("  cache                Manage cache\n")
-        print("Contextual Commands:")
-        print("  gl branch                   # Show current branch info")
-        print("  gl branch pipeline          # Show pipelines for current branch")
-        print("  gl branch mr                # Show MRs for current branch")
-        print("  gl branch commits           # Show commits for current branch")
-        print("  gl branch <name>            # Show specific branch info")
-        print("  gl branch <name> pipeline   # Show pipelines for specific branch")
-        print("  gl branch --create-mr       # Create MR from current branch\n")
-        print("  gl mr <id>                  # Show MR info")
-        print("  gl mr <id> diff             # Show MR diff")
-        print("  gl mr <id> pipeline         # Show MR pipelines")
-        print("  gl mr <id> commit           # Show MR commits")
-        print("  gl mr <id> discussion       # Show MR discussions\n")
-        print("Actions:")
-        print("  gl pipeline list            # List/search pipelines")
-        print("  gl pipeline <id>            # Show pipeline summary")
-        print("  gl pipeline detail <id>     # Show comprehensive info")
-        print("  gl pipeline graph <id>      # Show pipeline graph")
-        print("  gl pipeline retry <id>      # Retry failed jobs")
-        print("  gl pipeline rerun <id>      # Create new pipeline for same commit")
-        print("  gl pipeline cancel <id>     # Cancel pipeline\n")
-        print("  gl job <id>                 # Show job summary")
-        print("  gl job detail <id>          # Show comprehensive info")
-        print("  gl job logs <id>            # Show job logs")
-        print("  gl job tail <id>            # Tail job logs")
-        print("  gl job retry <id>           # Retry job")
-        print("  gl job play <id>            # Play manual job\n")
-        print("  gl mr search                # Search MRs with filters\n")
-        print("  gl cache stats              # Show cache statistics")
-        print("  gl cache list               # List cached pipelines")
-        print("  gl cache clear              # Clear cache\n")
-        print("  gl search code <term> -g <group>  # Search code across group")
-        print("    rg -v exclude_pattern ~/.cache/gitlab-cli/last_search.txt\n")
-        print("Diff View Options:")
-        print("  gl mr <id> diff             # Default view (from config)")
-        print("  gl mr <id> diff --view split    # Side-by-side diff")
-        print("  gl mr <id> diff --view inline   # Inline diff with line numbers")
-        print("  gl mr <id> diff --view unified  # Traditional git diff")
-        print("  gl mr <id> diff --stats         # Show only statistics")
-        print("  gl mr <id> diff --name-only     # Show only file names\n")
-        print("Common options:")
-        print("  --format <type>      Output as friendly, table, or json")
-        print("  --help               Show help for any command")
+        sys.stdout.write(MAIN_HELP)
 
     def route_command(self, args):
         """Route commands to appropriate handlers"""
+        if not args.area:
+            self.print_main_help()
+            return
+
         if args.area == "config":
             self.config_cmd.handle(self.config, args)
             return
@@ -398,7 +506,7 @@ class GitLabCLIv3:
             return
 
         if args.area == "search":
-            if not hasattr(args, "search_type") or not args.search_type:
+            if not getattr(args, "search_type", None):
                 print("Usage: gl search code <term> --group <group>")
                 sys.exit(1)
             if not self.config.gitlab_url:
@@ -407,29 +515,36 @@ class GitLabCLIv3:
             if not self.config.gitlab_token:
                 print("Error: GITLAB_TOKEN not set", file=sys.stderr)
                 sys.exit(1)
-            output_format = getattr(args, "format", None) or self.config.default_format
+            output_format = args.format or self.config.default_format
             self.code_search_cmd.handle(self.config, args, output_format)
             return
 
         if args.area in ["pipeline", "job", "mr", "merge-request", "branch"]:
             if (
-                (hasattr(args, "action") and args.action == "help")
-                or (hasattr(args, "mr_id") and args.mr_id == "help")
-                or (hasattr(args, "branch_name") and args.branch_name == "help")
+                getattr(args, "action", None) == "help"
+                or getattr(args, "mr_id", None) == "help"
+                or getattr(args, "branch_name", None) == "help"
             ):
-                parser = self.create_parser()
+                parser = self.create_parser(args.area)
                 parser.parse_args([args.area, "--help"])
                 return
 
-        valid, message = self.config.validate()
+        valid, message = self.validate_config()
         if not valid:
             print(f"Error: {message}", file=sys.stderr)
             sys.exit(1)
 
+        # Deferred: pulls in the gitlab SDK, which help paths never need
+        from .cli import PipelineCLI
+
+        # Reuse the client (and its HTTP session) across calls on this instance
         verbose = getattr(args, "verbose", False)
-        cli = PipelineCLI(self.config, verbose=verbose)
+        if self._cli is None:
+            self._cli = PipelineCLI(self.config, verbose=verbose)
+        cli = self._cli
+        cli.verbose = verbose
 
-        output_format = getattr(args, "format", None) or self.config.default_format
+        output_format = args.format or self.config.default_format
 
         if args.area == "branch":
             self.branch_cmd.handle(cli, args, output_format)
@@ -439,7 +554,7 @@ class GitLabCLIv3:
                 print("Error: Please provide MR ID or use 'gl mr --help' for help")
                 sys.exit(1)
             elif args.mr_id == "help":
-                parser = self.create_parser()
+                parser = self.create_parser(args.area)
                 parser.parse_args([args.area, "--help"])
             elif args.resource == "search" or (
                 args.mr_id == "search" and not args.resource
@@ -480,76 +595,11 @@ class GitLabCLIv3:
                 )
                 sys.exit(1)
             elif args.action == "help":
-                parser = self.create_parser()
+                parser = self.create_parser(args.area)
                 parser.parse_args([args.area, "--help"])
             elif args.action == "list":
                 self.search_cmd.list_pipelines(cli, args, output_format)
-            elif args.action == "detail":
-                if args.pipeline_id:
-                    try:
-                        pipeline_id = int(args.pipeline_id)
-                        self.pipelines_cmd.handle_pipeline_detail(
-                            cli, pipeline_id, args, output_format
-                        )
-                    except ValueError:
-                        print(f"Error: Invalid pipeline ID: {args.pipeline_id}")
-                        sys.exit(1)
-                else:
-                    print("Error: 'detail' requires a pipeline ID")
-                    sys.exit(1)
-            elif args.action == "graph":
-                if args.pipeline_id:
-                    try:
-                        pipeline_id = int(args.pipeline_id)
-                        self.pipelines_cmd.handle_pipeline_graph(
-                            cli, pipeline_id, args, output_format
-                        )
-                    except ValueError:
-                        print(f"Error: Invalid pipeline ID: {args.pipeline_id}")
-                        sys.exit(1)
-                else:
-                    print("Error: 'graph' requires a pipeline ID")
-                    sys.exit(1)
-            elif args.action == "retry":
-                if args.pipeline_id:
-                    try:
-                        pipeline_id = int(args.pipeline_id)
-                        self.pipelines_cmd.handle_pipeline_retry(
-                            cli, pipeline_id, args, output_format
-                        )
-                    except ValueError:
-                        print(f"Error: Invalid pipeline ID: {args.pipeline_id}")
-                        sys.exit(1)
-                else:
-                    print("Error: 'retry' requires a pipeline ID")
-                    sys.exit(1)
-            elif args.action == "rerun":
-                if args.pipeline_id:
-                    try:
-                        pipeline_id = int(args.pipeline_id)
-                        self.pipelines_cmd.handle_pipeline_rerun(
-                            cli, pipeline_id, args, output_format
-                        )
-                    except ValueError:
-                        print(f"Error: Invalid pipeline ID: {args.pipeline_id}")
-                        sys.exit(1)
-                else:
-                    print("Error: 'rerun' requires a pipeline ID")
-                    sys.exit(1)
-            elif args.action == "cancel":
-                if args.pipeline_id:
-                    try:
-                        pipeline_id = int(args.pipeline_id)
-                        self.pipelines_cmd.handle_pipeline_cancel(
-                            cli, pipeline_id, args, output_format
-                        )
-                    except ValueError:
-                        print(f"Error: Invalid pipeline ID: {args.pipeline_id}")
-                        sys.exit(1)
-                else:
-                    print("Error: 'cancel' requires a pipeline ID")
-                    sys.exit(1)
-            else:
+            elif not self._dispatch_action(cli, args, output_format):
                 ids = self.pipelines_cmd.parse_ids(args.action)
                 if getattr(args, "follow", False) and len(ids) == 1:
                     self.pipelines_cmd.handle_pipeline_follow(
@@ -563,79 +613,44 @@ class GitLabCLIv3:
                 print("Error: Please provide job ID(s) or use 'gl job --help' for help")
                 sys.exit(1)
             elif args.action == "help":
-                parser = self.create_parser()
+                parser = self.create_parser(args.area)
                 parser.parse_args([args.area, "--help"])
-            elif args.action == "detail":
-                if args.job_id:
-                    try:
-                        job_id = int(args.job_id)
-                        self.jobs_cmd.handle_job_detail(
-                            cli, job_id, args, output_format
-                        )
-                    except ValueError:
-                        print(f"Error: Invalid job ID: {args.job_id}")
-                        sys.exit(1)
-                else:
-                    print("Error: 'detail' requires a job ID")
-                    sys.exit(1)
-            elif args.action == "logs":
-                if args.job_id:
-                    try:
-                        job_id = int(args.job_id)
-                        self.jobs_cmd.handle_job_logs(cli, job_id, args, output_format)
-                    except ValueError:
-                        print(f"Error: Invalid job ID: {args.job_id}")
-                        sys.exit(1)
-                else:
-                    print("Error: 'logs' requires a job ID")
-                    sys.exit(1)
-            elif args.action == "tail":
-                if args.job_id:
-                    try:
-                        job_id = int(args.job_id)
-                        self.jobs_cmd.handle_job_tail(cli, job_id, args, output_format)
-                    except ValueError:
-                        print(f"Error: Invalid job ID: {args.job_id}")
-                        sys.exit(1)
-                else:
-                    print("Error: 'tail' requires a job ID")
-                    sys.exit(1)
-            elif args.action == "retry":
-                if args.job_id:
-                    try:
-                        job_id = int(args.job_id)
-                        self.jobs_cmd.handle_job_retry(cli, job_id, args, output_format)
-                    except ValueError:
-                        print(f"Error: Invalid job ID: {args.job_id}")
-                        sys.exit(1)
-                else:
-                    print("Error: 'retry' requires a job ID")
-                    sys.exit(1)
-            elif args.action == "play":
-                if args.job_id:
-                    try:
-                        job_id = int(args.job_id)
-                        self.jobs_cmd.handle_job_play(cli, job_id, args, output_format)
-                    except ValueError:
-                        print(f"Error: Invalid job ID: {args.job_id}")
-                        sys.exit(1)
-                else:
-                    print("Error: 'play' requires a job ID")
-                    sys.exit(1)
-            else:
+            elif not self._dispatch_action(cli, args, output_format):
                 ids = self.jobs_cmd.parse_ids(args.action)
                 self.jobs_cmd.handle_jobs(cli, ids, args, output_format)
 
+    def _dispatch_action(self, cli, args, output_format):
+        """Run an '<area> <action> <id>' command; False if the action isn't one"""
+        entry = _ACTION_TABLE.get((args.area, args.action))
+        if entry is None:
+            return False
+
+        # argparse has already converted the ID (type=int)
+        id_attr, cmd_attr, handler_name = entry
+        item_id = getattr(args, id_attr)
+        if item_id is None:
+            noun = id_attr[: -len("_id")]
+            print(f"Error: '{args.action}' requires a {noun} ID")
+            sys.exit(1)
+
+        handler = getattr(getattr(self, cmd_attr), handler_name)
+        handler(cli, item_id, args, output_format)
+        return True
+
     def run(self):
         """Main entry point"""
-        parser = self.create_parser()
-
+        # Top-level help doesn't need argparse, so skip building the parser
         if len(sys.argv) == 1 or (
             len(sys.argv) == 2 and sys.argv[1] in ["help", "--help", "-h"]
         ):
             self.print_main_help()
             sys.exit(0)
+        if len(sys.argv) == 2 and sys.argv[1] in ["--version", "-V"]:
+            print(f"gl {__version__}")
+            sys.exit(0)
 
+        # Only the invoked area's subparser is needed to parse this command
+        parser = self.create_parser(self._sniff_area(sys.argv[1:]))
         args = parser.parse_args()
 
         self.route_command(args)
@@ -1,23 +1,26 @@
 """GitLab CLI command modules"""
 
-from .branches import BranchesCommand
-from .pipelines import PipelineCommands
-from .jobs import JobCommands
-from .mrs import MRsCommand
-from .config import ConfigCommand
-from .cache import CacheCommand
-from .branch_context import BranchCommand
-from .mr_context import MRContextCommand
-from .code_search import CodeSearchCommand
+from importlib import import_module
 
-__all__ = [
-    'BranchesCommand',
-    'PipelineCommands',
-    'JobCommands',
-    'MRsCommand',
-    'ConfigCommand',
-    'CacheCommand',
-    'BranchCommand',
-    'MRContextCommand',
-    'CodeSearchCommand',
-]
\ No newline at end of file
+# Command class -> defining module; imported on first attribute access
+_LAZY = {
+    'BranchesCommand': '.branches',
+    'PipelineCommands': '.pipelines',
+    'JobCommands': '.jobs',
+    'MRsCommand': '.mrs',
+    'ConfigCommand': '.config',
+    'CacheCommand': '.cache',
+    'BranchCommand': '.branch_context',
+    'MRContextCommand': '.mr_context',
+    'CodeSearchCommand': '.code_search',
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
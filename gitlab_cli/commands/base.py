@@ -4,26 +4,216 @@
 
 """Base command class with common functionality"""
 
+import os
 import sys
 import json
-from typing import List
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Optional
+
+try:
+    import orjson
+except ImportError:  # optional, installed with the "fast" extra
+    orjson = None
+
+if orjson is not None:
+    ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+
+# Upper bound on concurrent API requests when fetching several IDs at once
+MAX_FETCH_WORKERS = 8
+
+# Display style per pipeline/job status: (icon, ANSI color, label); every
+# status icon, color and label shown by the commands comes from here
+STATUS_TABLE = {
+    "success": ("✅", "\033[92m", "[SUCCESS]"),
+    "failed": ("❌", "\033[91m", "[FAILED]"),
+    "running": ("🔄", "\033[93m", "[RUNNING]"),
+    "pending": ("⏳", "\033[90m", "[PENDING]"),
+    "canceled": ("🚫", "", "[CANCELED]"),
+    "skipped": ("⏭", "\033[90m", "[SKIPPED]"),
+    "manual": ("🎮", "", "[MANUAL]"),
+    "created": ("⏸", "", "[CREATED]"),
+}
+STATUS_DEFAULT = ("⏸", "", "[PENDING]")
+
+# Plain-text status labels for every pipeline status
+STATUS_LABELS = {status: row[2] for status, row in STATUS_TABLE.items()}
+
+# Display style per MR state: (icon, ANSI color)
+MR_STATE_TABLE = {
+    "opened": ("📂", "\033[92m"),
+    "merged": ("✅", "\033[94m"),
+    "closed": ("📕", "\033[91m"),
+    "locked": ("🔒", ""),
+}
+MR_STATE_DEFAULT = ("❓", "")
+
+# ANSI color per MR state, for views that only color the state text
+MR_STATE_COLORS = {state: row[1] for state, row in MR_STATE_TABLE.items()}
+
+# Row layout of the job tables (ID, status, stage, duration, name)
+JOB_ROW_FORMAT = "{:<12} {:<10} {:<15} {:<10} {:<50}".format
+
+
+def truncate(text: str, width: int = 50) -> str:
+    """Shorten text to width characters, marking the cut with '...'"""
+    return text if len(text) <= width else text[: width - 3] + "..."
+
+
+# Argument choices shared across the area parsers
+FORMAT_CHOICES = ("friendly", "table", "json")
+MR_STATE_CHOICES = ("opened", "merged", "closed", "all")
+DIFF_VIEW_CHOICES = ("inline", "split", "unified")
+PIPELINE_STATUS_CHOICES = (
+    "success",
+    "failed",
+    "running",
+    "pending",
+    "canceled",
+    "skipped",
+    "manual",
+    "created",
+)
+PIPELINE_SOURCE_CHOICES = (
+    "push",
+    "web",
+    "trigger",
+    "schedule",
+    "api",
+    "external",
+    "pipeline",
+    "chat",
+    "merge_request_event",
+)
+
+
+def _find_git_head() -> Optional[str]:
+    """Locate the HEAD file of the repository containing the working directory"""
+    path = os.getcwd()
+    while True:
+        dot_git = os.path.join(path, ".git")
+        if os.path.isdir(dot_git):
+            return os.path.join(dot_git, "HEAD")
+        if os.path.isfile(dot_git):
+            # Worktrees and submodules use a "gitdir: <path>" pointer file
+            try:
+                with open(dot_git) as f:
+                    content = f.read().strip()
+            except OSError:
+                return None
+            if not content.startswith("gitdir: "):
+                return None
+            git_dir = os.path.join(path, content[len("gitdir: ") :])
+            return os.path.join(git_dir, "HEAD")
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+
+@lru_cache(maxsize=1)
+def _current_branch() -> Optional[str]:
+    """Return the checked-out branch, or None outside a repo or when detached"""
+    head_file = None if "GIT_DIR" in os.environ else _find_git_head()
+    if head_file:
+        try:
+            with open(head_file) as f:
+                head = f.read().strip()
+            if head.startswith("ref: refs/heads/"):
+                branch = head[len("ref: refs/heads/") :]
+                # Reftable repos keep a placeholder HEAD naming ".invalid"
+                if branch != ".invalid":
+                    return branch
+            elif not head.startswith("ref: "):
+                return None  # detached HEAD
+        except OSError:
+            pass
+
+    # Unusual layouts (GIT_DIR, reftable, ...) - ask git itself
+    try:
+        result = subprocess.run(
+            ["git", "branch", "--show-current"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return result.stdout.strip() or None
+    except (subprocess.CalledProcessError, OSError):
+        return None
+
+
+def exit_now(code: int = 1):
+    """Flush output and exit without the interpreter shutdown sequence"""
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(code)
 
 
 class BaseCommand:
     """Base class for all command handlers"""
 
     def parse_ids(self, id_string: str) -> List[int]:
-        ids = []
-        for part in id_string.split(","):
+        parts = id_string.split(",")
+        try:
+            # int() tolerates the whitespace around each part
+            ids = [int(part) for part in parts]
+        except ValueError:
+            # Bad input only: find the first part int() rejects to report it
+            for part in parts:
+                try:
+                    int(part)
+                except ValueError:
+                    print(f"Invalid ID: {part}")
+                    sys.exit(1)
+        # Drop repeated IDs (keeping first-seen order) so each is fetched once
+        return list(dict.fromkeys(ids))
+
+    def get_current_branch(self) -> Optional[str]:
+        """Return the checked-out branch, read once per process"""
+        return _current_branch()
+
+    def fetch_all(self, fetch, ids):
+        """Call fetch(id) for each ID concurrently, keeping the input order.
+
+        Exceptions are returned in place of results so callers can report
+        failures per ID.
+        """
+
+        def safe_fetch(item_id):
             try:
-                ids.append(int(part.strip()))
-            except ValueError:
-                print(f"Invalid ID: {part}")
-                sys.exit(1)
-        return ids
+                return fetch(item_id)
+            except Exception as e:
+                return e
+
+        if len(ids) <= 1:
+            return [safe_fetch(item_id) for item_id in ids]
+
+        with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(ids))) as ex:
+            return list(ex.map(safe_fetch, ids))
 
     def output_json(self, data):
-        print(json.dumps(data, indent=2))
+        # default=str covers values the encoders do not know, such as
+        # SDK objects nested in attributes like mr.head_pipeline.
+        # Indent only for a terminal; piped output is read by tools like jq
+        pretty = sys.stdout.isatty()
+        if orjson is not None:
+            option = ORJSON_OPTIONS | orjson.OPT_INDENT_2 if pretty else ORJSON_OPTIONS
+            payload = orjson.dumps(data, default=str, option=option)
+            buffer = getattr(sys.stdout, "buffer", None)
+            if buffer is None:
+                sys.stdout.write(payload.decode())
+            else:
+                # orjson already produced UTF-8; flush first to keep ordering
+                sys.stdout.flush()
+                buffer.write(payload)
+            return
+        json.dump(data, sys.stdout, indent=2 if pretty else None, default=str)
+        sys.stdout.write("\n")
+
+    def output_lines(self, lines):
+        """Write rendered lines to stdout in a single call"""
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def output_error(self, message: str, output_format: str = "friendly"):
         if output_format == "json":
@@ -36,9 +226,8 @@ class BaseCommand:
         if duration is None:
             return "N/A"
 
-        hours = int(duration // 3600)
-        minutes = int((duration % 3600) // 60)
-        seconds = int(duration % 60)
+        hours, rem = divmod(int(duration), 3600)
+        minutes, seconds = divmod(rem, 60)
 
         if hours > 0:
             return f"{hours}h{minutes}m{seconds}s"
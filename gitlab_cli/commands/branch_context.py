@@ -5,13 +5,39 @@
 """Branch context commands - show branch info and related resources"""
 
 
+import shutil
 import subprocess
-import json
-import webbrowser
+import sys
 import urllib.parse
-from datetime import datetime
-from typing import Optional
-from .base import BaseCommand
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from .base import (
+    BaseCommand,
+    FORMAT_CHOICES,
+    MR_STATE_CHOICES,
+    PIPELINE_STATUS_CHOICES,
+    PIPELINE_SOURCE_CHOICES,
+    STATUS_LABELS,
+)
+
+# Tip commit fields read by get_branch_info, NUL-separated after the refname
+BRANCH_REF_FORMAT = (
+    "%(refname)%00%(objectname)%00%(authorname)%00%(authoremail)"
+    "%00%(authordate:relative)%00%(subject)"
+)
+
+# git log fields for the branch commit listing; NUL-separated so "|" or
+# other punctuation in commit subjects cannot shift the columns
+COMMIT_LOG_FORMAT = "%H%x00%s%x00%an%x00%ae%x00%ar"
+
+# How many of a branch's latest pipelines branch info reports as "recent"
+RECENT_PIPELINES = 5
+
+# Base branches for the ahead/behind comparison, in order of preference
+BASE_BRANCHES = ("main", "master")
+
+# git executable, resolved once so each subprocess call skips the PATH search
+_GIT = shutil.which("git") or "git"
 
 
 class BranchCommand(BaseCommand):
@@ -42,7 +68,7 @@ class BranchCommand(BaseCommand):
 
         parser.add_argument(
             "--state",
-            choices=["opened", "merged", "closed", "all"],
+            choices=MR_STATE_CHOICES,
             default="opened",
             help="Filter by state (for MRs)",
         )
@@ -56,31 +82,12 @@ class BranchCommand(BaseCommand):
         )
         parser.add_argument(
             "--source",
-            choices=[
-                "push",
-                "web",
-                "trigger",
-                "schedule",
-                "api",
-                "external",
-                "pipeline",
-                "chat",
-                "merge_request_event",
-            ],
+            choices=PIPELINE_SOURCE_CHOICES,
             help="Filter pipelines by source type",
         )
         parser.add_argument(
             "--status",
-            choices=[
-                "success",
-                "failed",
-                "running",
-                "pending",
-                "canceled",
-                "skipped",
-                "manual",
-                "created",
-            ],
+            choices=PIPELINE_STATUS_CHOICES,
             help="Filter pipelines by status",
         )
         parser.add_argument(
@@ -105,22 +112,13 @@ class BranchCommand(BaseCommand):
             help="Show stage environment URL for the branch",
         )
         parser.add_argument(
-            "--format", choices=["friendly", "table", "json"], help="Output format"
+            "--no-cache",
+            action="store_true",
+            help="Bypass the short-lived branch, MR and pipeline cache",
         )
+        parser.add_argument("--format", choices=FORMAT_CHOICES, help="Output format")
 
-    def get_current_branch(self) -> Optional[str]:
-        try:
-            result = subprocess.run(
-                ["git", "branch", "--show-current"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            return result.stdout.strip()
-        except:
-            return None
-
-    def get_branch_info(self, cli, branch_name: str) -> dict:
+    def get_branch_info(self, cli, branch_name: str, use_cache: bool = False) -> dict:
         info = {
             "name": branch_name,
             "exists_locally": False,
@@ -130,84 +128,88 @@ class BranchCommand(BaseCommand):
             "age": None,
             "author": None,
         }
+        # The GitLab lookup does not depend on the local git queries, so
+        # it runs while git does
+        with ThreadPoolExecutor(max_workers=1) as ex:
+            remote_future = ex.submit(cli.explorer.get_branch, branch_name, use_cache)
+            self._add_local_branch_info(info, branch_name)
+            try:
+                # Exact lookup; a missing branch raises and leaves
+                # exists_remote False
+                branch = remote_future.result()
+                info["exists_remote"] = True
+                info["protected"] = branch.protected
+                info["merged"] = branch.merged
+                project_url = cli.explorer.project.web_url
+                info["web_url"] = f"{project_url}/-/tree/{branch_name}"
+                commit = getattr(branch, "commit", None)
+                if commit:
+                    info["remote_commit"] = commit["id"][:8]
+            except Exception:
+                pass
+
+        return info
+
+    def _add_local_branch_info(self, info: dict, branch_name: str):
         try:
+            # One for-each-ref reads the branch tip and which base branch
+            # exists, instead of a separate git process per question
             result = subprocess.run(
-                ["git", "rev-parse", "--verify", branch_name],
-                capture_output=True,
-                text=True,
-            )
-            info["exists_locally"] = result.returncode == 0
-        except:
-            pass
-        try:
-            result = subprocess.run(
-                ["git", "log", "-1", "--format=%H|%s|%an|%ae|%ar", branch_name],
+                [
+                    _GIT,
+                    "for-each-ref",
+                    f"--format={BRANCH_REF_FORMAT}",
+                    f"refs/heads/{branch_name}",
+                    *[f"refs/remotes/origin/{base}" for base in BASE_BRANCHES],
+                ],
                 capture_output=True,
-                text=True,
                 check=True,
             )
-            if result.stdout:
-                parts = result.stdout.strip().split("|")
-                if len(parts) >= 5:
-                    info["last_commit"] = {
-                        "sha": parts[0][:8],
-                        "message": parts[1][:60],
-                        "author": parts[2],
-                        "email": parts[3],
-                        "age": parts[4],
-                    }
-                    info["age"] = parts[4]
-                    info["author"] = parts[2]
-        except:
-            pass
-        try:
-            # Try to find the main branch
-            for main_branch in ["main", "master"]:
-                result = subprocess.run(
-                    ["git", "rev-parse", "--verify", f"origin/{main_branch}"],
-                    capture_output=True,
-                    text=True,
-                )
-                if result.returncode == 0:
+            refs = {}
+            # Decode as UTF-8 explicitly; the locale may be C/POSIX
+            output = result.stdout.decode("utf-8", "replace")
+            for line in output.split("\n"):
+                refname, _, fields = line.partition("\0")
+                refs[refname] = fields.split("\0")
+            # Patterns also match refs nested below them, so look up exactly
+            parts = refs.get(f"refs/heads/{branch_name}")
+            if parts and len(parts) >= 5:
+                info["exists_locally"] = True
+                info["last_commit"] = {
+                    "sha": parts[0][:8],
+                    "message": parts[4][:60],
+                    "author": parts[1],
+                    "email": parts[2].strip("<>"),
+                    "age": parts[3],
+                }
+                info["age"] = parts[3]
+                info["author"] = parts[1]
 
+                main_branch = next(
+                    (b for b in BASE_BRANCHES if f"refs/remotes/origin/{b}" in refs),
+                    None,
+                )
+                if main_branch:
                     result = subprocess.run(
                         [
-                            "git",
+                            _GIT,
                             "rev-list",
                             "--left-right",
                             "--count",
                             f"origin/{main_branch}...{branch_name}",
                         ],
                         capture_output=True,
-                        text=True,
                     )
                     if result.stdout:
-                        behind, ahead = result.stdout.strip().split("\t")
+                        # int() parses the ASCII counts straight from bytes
+                        behind, ahead = result.stdout.split()
                         info["ahead_behind"] = {
                             "ahead": int(ahead),
                             "behind": int(behind),
                             "base": main_branch,
                         }
-                    break
-        except:
+        except (subprocess.CalledProcessError, OSError, ValueError):
             pass
-        try:
-            branches = cli.explorer.project.branches.list(search=branch_name)
-            for branch in branches:
-                if branch.name == branch_name:
-                    info["exists_remote"] = True
-                    info["protected"] = branch.protected
-                    info["merged"] = branch.merged
-                    info["web_url"] = (
-                        f"{cli.explorer.project.web_url}/-/tree/{branch_name}"
-                    )
-                    if hasattr(branch, "commit"):
-                        info["remote_commit"] = branch.commit["id"][:8]
-                    break
-        except:
-            pass
-
-        return info
 
     def handle(self, cli, args, output_format):
 
@@ -271,7 +273,9 @@ class BranchCommand(BaseCommand):
 
         # If no resource specified, show branch info
         if not resource or resource == "info":
-            self.show_branch_info(cli, branch_name, output_format)
+            self.show_branch_info(
+                cli, branch_name, output_format, not getattr(args, "no_cache", False)
+            )
         elif resource == "mr":
             self.show_branch_mrs(cli, branch_name, args, output_format)
         elif resource in ["mr-approvals", "approvals"]:
@@ -281,23 +285,35 @@ class BranchCommand(BaseCommand):
         elif resource == "commit":
             self.show_branch_commits(cli, branch_name, args, output_format)
 
-    def show_branch_info(self, cli, branch_name, output_format):
-        info = self.get_branch_info(cli, branch_name)
-        try:
-            mrs = cli.explorer.get_mrs_for_branch(branch_name, "all")
-            mr_counts = {
-                "total": len(mrs),
-                "opened": len([m for m in mrs if m["state"] == "opened"]),
-                "merged": len([m for m in mrs if m["state"] == "merged"]),
-                "closed": len([m for m in mrs if m["state"] == "closed"]),
-            }
-            pipelines = cli.explorer.project.pipelines.list(ref=branch_name, per_page=5)
-            pipeline_count = len(pipelines)
-            latest_pipeline = pipelines[0] if pipelines else None
-        except:
-            mr_counts = {"total": 0, "opened": 0, "merged": 0, "closed": 0}
-            pipeline_count = 0
-            latest_pipeline = None
+    def show_branch_info(self, cli, branch_name, output_format, use_cache=False):
+        # Git queries, the MR listing and the pipeline listing are independent
+        with ThreadPoolExecutor(max_workers=3) as ex:
+            info_future = ex.submit(self.get_branch_info, cli, branch_name, use_cache)
+            mrs_future = ex.submit(
+                cli.explorer.get_mrs_for_branch, branch_name, "all", use_cache
+            )
+            pipelines_future = ex.submit(
+                cli.explorer.get_latest_pipeline, branch_name, use_cache
+            )
+            info = info_future.result()
+            try:
+                mrs = mrs_future.result()
+                state_counts = Counter(m["state"] for m in mrs)
+                mr_counts = {
+                    "total": len(mrs),
+                    "opened": state_counts["opened"],
+                    "merged": state_counts["merged"],
+                    "closed": state_counts["closed"],
+                }
+                total, latest_pipeline = pipelines_future.result()
+                if total is None:
+                    # No X-Total means more than GitLab will count
+                    total = RECENT_PIPELINES if latest_pipeline else 0
+                pipeline_count = min(total, RECENT_PIPELINES)
+            except Exception:
+                mr_counts = {"total": 0, "opened": 0, "merged": 0, "closed": 0}
+                pipeline_count = 0
+                latest_pipeline = None
 
         if output_format == "json":
             output = {
@@ -316,12 +332,10 @@ class BranchCommand(BaseCommand):
                     ),
                 },
             }
-            print(json.dumps(output, indent=2))
+            self.output_json(output)
         else:
-            # Friendly output
-            print(f"\n{'='*60}")
-            print(f"Branch: {branch_name}")
-            print(f"{'='*60}\n")
+            # Friendly output, collected and written in one go
+            out = [f"\n{'='*60}", f"Branch: {branch_name}", f"{'='*60}\n"]
 
             # Branch status
             status_parts = []
@@ -335,50 +349,50 @@ class BranchCommand(BaseCommand):
                 status_parts.append("Merged")
 
             if status_parts:
-                print(f"Status: {' | '.join(status_parts)}")
+                out.append(f"Status: {' | '.join(status_parts)}")
 
             # Last commit
             if info["last_commit"]:
                 commit = info["last_commit"]
-                print(f"\nLast Commit:")
-                print(f"  {commit['sha']} - {commit['message']}")
-                print(f"  by {commit['author']} ({commit['age']})")
+                out.append("\nLast Commit:")
+                out.append(f"  {commit['sha']} - {commit['message']}")
+                out.append(f"  by {commit['author']} ({commit['age']})")
 
             # Ahead/behind
             if info["ahead_behind"]:
                 ab = info["ahead_behind"]
-                print(f"\nCompared to {ab['base']}:")
-                print(f"  ↑ {ab['ahead']} ahead | ↓ {ab['behind']} behind")
+                out.append(f"\nCompared to {ab['base']}:")
+                out.append(f"  ↑ {ab['ahead']} ahead | ↓ {ab['behind']} behind")
 
             # Related resources
-            print(f"\nRelated Resources:")
-            print(f"  Merge Requests: {mr_counts['total']} total", end="")
+            out.append("\nRelated Resources:")
+            mr_line = f"  Merge Requests: {mr_counts['total']} total"
             if mr_counts["opened"] > 0:
-                print(f" ({mr_counts['opened']} open)", end="")
-            print()
+                mr_line += f" ({mr_counts['opened']} open)"
+            out.append(mr_line)
 
-            print(f"  Pipelines: {pipeline_count} recent", end="")
+            pipeline_line = f"  Pipelines: {pipeline_count} recent"
             if latest_pipeline:
-                status_icon = {
-                    "success": "[SUCCESS]",
-                    "failed": "[FAILED]",
-                    "running": "[RUNNING]",
-                }.get(latest_pipeline.status, "[UNKNOWN]")
-                print(f" (latest: {status_icon} {latest_pipeline.status})", end="")
-            print()
+                status_icon = STATUS_LABELS.get(latest_pipeline.status, "[UNKNOWN]")
+                pipeline_line += f" (latest: {status_icon} {latest_pipeline.status})"
+            out.append(pipeline_line)
 
             # Quick actions
-            print(f"\nQuick Actions:")
-            print(f"  gl branch {branch_name} mr         # Show merge requests")
-            print(f"  gl branch {branch_name} pipeline   # Show pipelines")
-            print(f"  gl branch {branch_name} commit     # Show recent commits")
+            out.append("\nQuick Actions:")
+            out.append(f"  gl branch {branch_name} mr         # Show merge requests")
+            out.append(f"  gl branch {branch_name} pipeline   # Show pipelines")
+            out.append(f"  gl branch {branch_name} commit     # Show recent commits")
 
             # URLs
             if info.get("web_url"):
-                print(f"\nBRANCH_URL: {info['web_url']}")
+                out.append(f"\nBRANCH_URL: {info['web_url']}")
+
+            self.output_lines(out)
 
     def show_branch_mrs(self, cli, branch_name, args, output_format):
-        mrs = cli.explorer.get_mrs_for_branch(branch_name, args.state)
+        mrs = cli.explorer.get_mrs_for_branch(
+            branch_name, args.state, not getattr(args, "no_cache", False)
+        )
 
         if not mrs:
             # When using --latest, silently exit with error code (for scripting)
@@ -387,32 +401,35 @@ class BranchCommand(BaseCommand):
                 print(
                     f"No {args.state} merge requests found for branch '{branch_name}'"
                 )
-            import sys
-
             sys.exit(1)  # Exit with error code for scripting
         if args.latest:
-
-            mrs = sorted(mrs, key=lambda x: x["created_at"], reverse=True)[:1]
+            mrs = [max(mrs, key=lambda x: x["created_at"])]
         else:
             # Limit results normally
             mrs = mrs[: args.limit]
 
         if output_format == "json":
-            print(json.dumps({"merge_requests": mrs}, indent=2))
+            self.output_json({"merge_requests": mrs})
         else:
-            print(f"\nMerge Requests for branch '{branch_name}' (state: {args.state}):")
-            print("-" * 80)
+            out = [
+                f"\nMerge Requests for branch '{branch_name}' (state: {args.state}):",
+                "-" * 80,
+            ]
 
             for mr in mrs:
-                print(f"\n!{mr['iid']}: {mr['title']}")
-                print(f"   State: {mr['state']}")
-                print(f"   Author: @{mr['author']}")
-                print(f"   Target: {mr['target_branch']}")
-                print(f"   Created: {mr['created_at'][:10]}")
+                out.append(f"\n!{mr['iid']}: {mr['title']}")
+                out.append(f"   State: {mr['state']}")
+                out.append(f"   Author: @{mr['author']}")
+                out.append(f"   Target: {mr['target_branch']}")
+                out.append(f"   Created: {mr['created_at'][:10]}")
                 if mr["pipeline_id"]:
-                    print(f"   Pipeline: #{mr['pipeline_id']} {mr['pipeline_status']}")
-                print(f"   MR_ID: {mr['iid']}")
-                print(f"   MR_URL: {mr['web_url']}")
+                    out.append(
+                        f"   Pipeline: #{mr['pipeline_id']} {mr['pipeline_status']}"
+                    )
+                out.append(f"   MR_ID: {mr['iid']}")
+                out.append(f"   MR_URL: {mr['web_url']}")
+
+            self.output_lines(out)
 
     def show_branch_mr_approvals(self, cli, branch_name, args, output_format):
         mrs = cli.explorer.get_mrs_for_branch(branch_name, "opened")
@@ -442,7 +459,7 @@ class BranchCommand(BaseCommand):
                         "eligible_approvers": [u["username"] for u in getattr(rule, "eligible_approvers", [])],
                     }
                     approval_rules.append(rule_data)
-            except:
+            except Exception:
                 pass
 
             if output_format == "json":
@@ -455,7 +472,7 @@ class BranchCommand(BaseCommand):
                     "approved_by": approved_by,
                     "approval_rules": approval_rules,
                 }
-                print(json.dumps(output, indent=2))
+                self.output_json(output)
             else:
                 print(f"\nApprovals for MR !{mr.iid}: {mr.title}")
                 print("-" * 80)
@@ -511,15 +528,16 @@ class BranchCommand(BaseCommand):
             if status_filter:
                 list_params["status"] = status_filter
 
-            pipelines = cli.explorer.project.pipelines.list(
-                **list_params, get_all=False
+            pipelines = cli.explorer.list_pipelines(
+                not getattr(args, "no_cache", False), **list_params
             )
             filtered_pipelines = []
             for p in pipelines:
                 # Skip pipelines created by GitLab Security Policy Bot
-                if hasattr(p, "user") and p.user:
-                    username = p.user.get("username", "")
-                    name = p.user.get("name", "")
+                user = getattr(p, "user", None)
+                if user:
+                    username = user.get("username", "")
+                    name = user.get("name", "")
                     if (
                         "security-policy-bot" in username.lower()
                         or "security policy bot" in name.lower()
@@ -558,33 +576,26 @@ class BranchCommand(BaseCommand):
                             "status": p.status,
                             "source": p.source,
                             "created_at": p.created_at,
-                            "user": (
-                                p.user.get("username")
-                                if hasattr(p, "user") and p.user
-                                else None
-                            ),
+                            "user": (getattr(p, "user", None) or {}).get("username"),
                             "web_url": p.web_url,
                         }
                         for p in pipelines
                     ]
                 }
-                print(json.dumps(output, indent=2))
+                self.output_json(output)
             else:
-                print(f"\nRecent Pipelines for branch '{branch_name}':")
-                print("-" * 80)
+                out = [
+                    f"\nRecent Pipelines for branch '{branch_name}':",
+                    "-" * 80,
+                ]
 
                 for p in pipelines:
-                    status_icon = {
-                        "success": "[SUCCESS]",
-                        "failed": "[FAILED]",
-                        "running": "[RUNNING]",
-                        "pending": "[PENDING]",
-                        "canceled": "[CANCELED]",
-                    }.get(p.status, "[UNKNOWN]")
+                    status_icon = STATUS_LABELS.get(p.status, "[UNKNOWN]")
                     user_str = ""
-                    if hasattr(p, "user") and p.user:
-                        username = p.user.get("username", "unknown")
-                        name = p.user.get("name", "")
+                    user = getattr(p, "user", None)
+                    if user:
+                        username = user.get("username", "unknown")
+                        name = user.get("name", "")
                         if name and name != username:
                             user_str = f"@{username} ({name})"
                         else:
@@ -592,69 +603,72 @@ class BranchCommand(BaseCommand):
 
                     created = p.created_at[:19].replace("T", " ")
 
-                    print(f"\n{status_icon} Pipeline #{p.id} - {p.status}")
-                    print(f"   Source: {p.source}")
-                    print(
-                        f"   Created by: {user_str}"
-                        if user_str
-                        else "   Created by: Unknown"
-                    )
-                    print(f"   Created at: {created}")
-                    print(f"   PIPELINE_URL: {p.web_url}")
-                    print(f"   PIPELINE_ID: {p.id}")
+                    out.append(f"\n{status_icon} Pipeline #{p.id} - {p.status}")
+                    out.append(f"   Source: {p.source}")
+                    out.append(f"   Created by: {user_str or 'Unknown'}")
+                    out.append(f"   Created at: {created}")
+                    out.append(f"   PIPELINE_URL: {p.web_url}")
+                    out.append(f"   PIPELINE_ID: {p.id}")
+
+                self.output_lines(out)
 
         except Exception as e:
             print(f"Error fetching pipelines: {e}")
 
     def show_branch_commits(self, cli, branch_name, args, output_format):
         try:
-
-            result = subprocess.run(
+            commits = []
+            found = False
+            with subprocess.Popen(
                 [
-                    "git",
+                    _GIT,
                     "log",
                     f"--max-count={args.limit}",
-                    "--format=%H|%s|%an|%ae|%ar",
+                    f"--format={COMMIT_LOG_FORMAT}",
                     branch_name,
                 ],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-
-            if not result.stdout:
-                print(f"No commits found on branch '{branch_name}'")
-                return
-
-            commits = []
-            for line in result.stdout.strip().split("\n"):
-                parts = line.split("|")
-                if len(parts) >= 5:
-                    commits.append(
-                        {
-                            "sha": parts[0][:8],
-                            "message": parts[1],
-                            "author": parts[2],
-                            "email": parts[3],
-                            "age": parts[4],
-                        }
-                    )
-
-            if output_format == "json":
-                print(json.dumps({"commits": commits}, indent=2))
-            else:
-                print(f"\nRecent Commits on branch '{branch_name}':")
-                print("-" * 80)
-
-                for commit in commits:
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            ) as proc:
+                # Parse each commit as git writes it; friendly output is
+                # printed right away instead of after the whole log is read
+                for line in proc.stdout:
+                    rest = line.decode("utf-8", "replace").rstrip("\n")
+                    sha, _, rest = rest.partition("\0")
+                    message, _, rest = rest.partition("\0")
+                    author, _, rest = rest.partition("\0")
+                    email, sep, age = rest.partition("\0")
+                    if not sep:
+                        # Fewer than five fields; not a commit line
+                        continue
+                    commit = {
+                        "sha": sha[:8],
+                        "message": message,
+                        "author": author,
+                        "email": email,
+                        "age": age,
+                    }
+                    if output_format == "json":
+                        commits.append(commit)
+                        continue
+                    if not found:
+                        print(f"\nRecent Commits on branch '{branch_name}':")
+                        print("-" * 80)
+                    found = True
                     print(f"\n{commit['sha']} - {commit['message'][:60]}")
                     print(f"   by {commit['author']} ({commit['age']})")
+            if proc.returncode:
+                raise subprocess.CalledProcessError(proc.returncode, proc.args)
+
+            if not (found or commits):
+                print(f"No commits found on branch '{branch_name}'")
+            elif output_format == "json":
+                self.output_json({"commits": commits})
 
         except Exception as e:
             print(f"Error fetching commits: {e}")
 
     def create_mr_for_branch(self, cli, branch_name, args, output_format):
-        import urllib.parse
         import webbrowser
 
         gitlab_url = cli.config.gitlab_url
@@ -671,11 +685,8 @@ class BranchCommand(BaseCommand):
         full_url = f"{base_url}?{query_string}"
 
         if output_format == "json":
-            print(
-                json.dumps(
-                    {"action": "create_mr", "branch": branch_name, "url": full_url},
-                    indent=2,
-                )
+            self.output_json(
+                {"action": "create_mr", "branch": branch_name, "url": full_url}
             )
         else:
             print(f"\nCreate MR for branch '{branch_name}':")
@@ -689,6 +700,8 @@ class BranchCommand(BaseCommand):
                 print(f"Could not open browser automatically: {e}")
 
     def open_branch_in_browser(self, cli, branch_name):
+        import webbrowser
+
         try:
 
             project = cli.explorer.project
@@ -715,6 +728,8 @@ class BranchCommand(BaseCommand):
             print(f"Error opening branch in browser: {e}")
 
     def open_mr_in_browser(self, cli, branch_name):
+        import webbrowser
+
         try:
 
             mrs = cli.explorer.get_mrs_for_branch(branch_name, "opened")
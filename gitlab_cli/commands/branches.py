@@ -4,9 +4,8 @@
 
 """Branches command handler"""
 
-import subprocess
 import webbrowser
-from .base import BaseCommand
+from .base import BaseCommand, FORMAT_CHOICES, MR_STATE_CHOICES
 
 
 class BranchesCommand(BaseCommand):
@@ -16,7 +15,7 @@ class BranchesCommand(BaseCommand):
         )
         parser.add_argument(
             "--state",
-            choices=["opened", "merged", "closed", "all"],
+            choices=MR_STATE_CHOICES,
             default="opened",
             help="Filter by MR state (default: opened)",
         )
@@ -33,18 +32,12 @@ class BranchesCommand(BaseCommand):
             action="store_true",
             help="Show stage environment URL for the branch",
         )
-        parser.add_argument(
-            "--format", choices=["friendly", "table", "json"], help="Output format"
-        )
+        parser.add_argument("--format", choices=FORMAT_CHOICES, help="Output format")
 
     def handle(self, cli, args, output_format):
         if not args.branch_name:
-            result = subprocess.run(
-                ["git", "branch", "--show-current"], capture_output=True, text=True
-            )
-            if result.returncode == 0:
-                args.branch_name = result.stdout.strip()
-            else:
+            args.branch_name = self.get_current_branch()
+            if not args.branch_name:
                 self.output_error("Not in a git repository or cannot determine branch")
 
         if args.stage_url:
@@ -73,6 +66,5 @@ class BranchesCommand(BaseCommand):
                 print(f"You can manually open: {mr_url}")
             return
 
-        args.format = output_format
         cli.cmd_branch_mrs(args)
 
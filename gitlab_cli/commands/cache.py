@@ -7,6 +7,9 @@
 import sqlite3
 from .base import BaseCommand
 
+# Row layout of the cached pipeline list (ID, status, ref, cached at, size)
+CACHED_PIPELINE_ROW_FORMAT = "{:<12} {:<10} {:<20} {:<20} {:<10}".format
+
 
 class CacheCommand(BaseCommand):
 
@@ -191,13 +194,20 @@ class CacheCommand(BaseCommand):
             count = cur.fetchone()[0]
 
             if not args.force:
-                response = input(f"Delete ALL {count} cached pipelines? (y/N): ")
+                response = input(
+                    f"Delete ALL {count} cached pipelines and API responses? (y/N): "
+                )
                 if response.lower() != "y":
                     print("Cancelled")
                     return
 
             cur.execute("DELETE FROM pipelines")
             affected = cur.rowcount
+            try:
+                cur.execute("DELETE FROM responses")
+            except sqlite3.OperationalError:
+                # Cache files from before the response cache have no table
+                pass
             conn.commit()
 
             cur.execute("VACUUM")
@@ -251,7 +261,9 @@ class CacheCommand(BaseCommand):
         print(f"Cached Pipelines (sorted by {args.sort}, limit {args.limit})")
         print("=" * 80)
         print(
-            f"{'Pipeline ID':<12} {'Status':<10} {'Branch/Tag':<20} {'Cached At':<20} {'Size':<10}"
+            CACHED_PIPELINE_ROW_FORMAT(
+                "Pipeline ID", "Status", "Branch/Tag", "Cached At", "Size"
+            )
         )
         print("-" * 80)
 
@@ -262,7 +274,9 @@ class CacheCommand(BaseCommand):
             size_display = self._format_size(size)
 
             print(
-                f"{pid:<12} {status_display:<10} {ref_display:<20} {created_display:<20} {size_display:<10}"
+                CACHED_PIPELINE_ROW_FORMAT(
+                    pid, status_display, ref_display, created_display, size_display
+                )
             )
         cur.execute("SELECT COUNT(*) FROM pipelines")
         total = cur.fetchone()[0]
@@ -4,8 +4,6 @@
 
 """Code search across GitLab group projects"""
 
-import gitlab
-import json
 import os
 import re
 from datetime import datetime
@@ -15,6 +13,8 @@ from .base import BaseCommand
 class CodeSearchCommand(BaseCommand):
 
     def handle(self, config, args, output_format):
+        import gitlab
+
         search_term = args.search_term
         group_path = args.group
 
@@ -114,7 +114,7 @@ class CodeSearchCommand(BaseCommand):
                 "total": len(formatted),
                 "projects_searched": len(seen_projects),
             }
-            print(json.dumps(output, indent=2))
+            self.output_json(output)
         else:
             lines = []
             for r in formatted:
@@ -4,7 +4,7 @@
 
 """Configuration command handler"""
 
-from .base import BaseCommand
+from .base import BaseCommand, FORMAT_CHOICES, DIFF_VIEW_CHOICES
 
 
 class ConfigCommand(BaseCommand):
@@ -26,42 +26,44 @@ class ConfigCommand(BaseCommand):
         set_parser.add_argument("--project", help="GitLab project path")
         set_parser.add_argument(
             "--default-format",
-            choices=["friendly", "table", "json"],
+            choices=FORMAT_CHOICES,
             help="Default output format",
         )
         set_parser.add_argument(
             "--diff-view",
-            choices=["unified", "inline", "split"],
+            choices=DIFF_VIEW_CHOICES,
             help="Default diff view mode (unified, inline, or split)",
         )
 
     def handle(self, config, args):
-        if not hasattr(args, "action") or not args.action:
+        action = getattr(args, "action", None) or "show"
 
-            args.action = "show"
-
-        if args.action == "show":
+        if action == "show":
             self.show_config(config)
-        elif args.action == "set":
+        elif action == "set":
             self.set_config(config, args)
 
     def show_config(self, config):
-        print(f"GitLab URL:     {config.gitlab_url or 'Not set'}")
-        print(f"Project:        {config.project_path or 'Not set (auto-detected)'}")
-        print(f"Token:          {'Set' if config.gitlab_token else 'Not set'}")
-        print(f"Default format: {config.default_format}")
-        print(f"Diff view:      {config.diff_view}")
-        print(f"Cache dir:      {config.cache_dir}")
+        self.output_lines(
+            [
+                f"GitLab URL:     {config.gitlab_url or 'Not set'}",
+                f"Project:        {config.project_path or 'Not set (auto-detected)'}",
+                f"Token:          {'Set' if config.gitlab_token else 'Not set'}",
+                f"Default format: {config.default_format}",
+                f"Diff view:      {config.diff_view}",
+                f"Cache dir:      {config.cache_dir}",
+            ]
+        )
 
     def set_config(self, config, args):
         update = {}
-        if hasattr(args, "gitlab_url") and args.gitlab_url:
+        if getattr(args, "gitlab_url", None):
             update["gitlab_url"] = args.gitlab_url
-        if hasattr(args, "project") and args.project:
+        if getattr(args, "project", None):
             update["project_path"] = args.project
-        if hasattr(args, "default_format") and args.default_format:
+        if getattr(args, "default_format", None):
             update["default_format"] = args.default_format
-        if hasattr(args, "diff_view") and args.diff_view:
+        if getattr(args, "diff_view", None):
             update["diff_view"] = args.diff_view
 
         if update:
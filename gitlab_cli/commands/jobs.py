@@ -5,19 +5,49 @@
 """Job command handlers for GitLab CLI"""
 
 import sys
-import json
 import time
-from .base import BaseCommand
+from .base import (
+    BaseCommand,
+    JOB_ROW_FORMAT,
+    STATUS_TABLE,
+    STATUS_DEFAULT,
+    truncate,
+)
 
 
 class JobCommands(BaseCommand):
 
     def handle_jobs(self, cli, ids, args, output_format):
         all_jobs = []
+        use_cache = not getattr(args, "no_cache", False)
+        jobs = self.fetch_all(
+            lambda job_id: cli.explorer.get_job(job_id, use_cache), ids
+        )
+
+        # Each failure lookup is a job GET plus a trace download, so fetch
+        # them for all failed jobs together as well
+        failure_details = {}
+        if args.failures and output_format != "table":
+            failed_ids = [
+                job_id
+                for job_id, job in zip(ids, jobs)
+                if not isinstance(job, Exception) and job.status == "failed"
+            ]
+            failure_details = dict(
+                zip(
+                    failed_ids,
+                    self.fetch_all(cli.explorer.get_failed_job_details, failed_ids),
+                )
+            )
 
-        for job_id in ids:
+        separate = len(ids) > 1
+        for job_id, job in zip(ids, jobs):
             try:
-                job = cli.explorer.project.jobs.get(job_id)
+                if isinstance(job, Exception):
+                    raise job
+                details = failure_details.get(job_id)
+                if isinstance(details, Exception):
+                    raise details
 
                 if output_format == "json":
                     job_data = {
@@ -32,8 +62,7 @@ class JobCommands(BaseCommand):
                         "web_url": job.web_url,
                     }
 
-                    if args.failures and job.status == "failed":
-                        details = cli.explorer.get_failed_job_details(job_id)
+                    if details is not None:
                         job_data["failures"] = details.get("failures", {})
 
                     all_jobs.append(job_data)
@@ -48,7 +77,9 @@ class JobCommands(BaseCommand):
                         }
                     )
                 else:
-                    self._display_job_summary(cli, job, job_id, args, len(ids))
+                    self._display_job_summary(cli, job, job_id, args, details)
+                    if separate:
+                        print("-" * 60)
 
             except Exception as e:
                 if output_format == "json":
@@ -63,7 +94,9 @@ class JobCommands(BaseCommand):
 
     def handle_job_detail(self, cli, job_id, args, output_format):
         try:
-            job = cli.explorer.project.jobs.get(job_id)
+            job = cli.explorer.get_job(
+                job_id, use_cache=not getattr(args, "no_cache", False)
+            )
             dependencies = self._get_job_dependencies(cli, job)
 
             if output_format == "json":
@@ -78,9 +111,15 @@ class JobCommands(BaseCommand):
 
     def handle_job_logs(self, cli, job_id, args, output_format):
         try:
-            job = cli.explorer.project.jobs.get(job_id)
+            job = cli.explorer.get_job(
+                job_id, use_cache=not getattr(args, "no_cache", False)
+            )
             trace = job.trace()
 
+            # Cut the raw bytes before decoding so only the tail is copied
+            last_kb = getattr(args, "last_kb", None)
+            if last_kb:
+                trace = trace[-last_kb * 1024 :]
             if isinstance(trace, bytes):
                 trace = trace.decode("utf-8", errors="replace")
 
@@ -109,7 +148,7 @@ class JobCommands(BaseCommand):
 
             print(f"Tailing logs for job #{job_id}: {job.name}")
             print(f"Status: {job.status}")
-            print(f"{'='*60}")
+            print("=" * 60)
 
             last_size = 0
             poll_interval = 2  # seconds
@@ -135,16 +174,16 @@ class JobCommands(BaseCommand):
                     sys.stdout.flush()
                     last_size = current_size
                 if job.status in completed_statuses:
-                    print(f"\n{'='*60}")
+                    print("\n" + "=" * 60)
                     print(f"Job completed with status: {job.status}")
                     if job.status == "failed" and getattr(args, "failures", False):
                         failures = cli.explorer.extract_failures_from_trace(
                             trace, job.name
                         )
                         if failures.get("summary") or failures.get("details"):
-                            print(f"\n{'='*60}")
+                            print("\n" + "=" * 60)
                             print("Failure Analysis:")
-                            print(f"{'='*60}")
+                            print("=" * 60)
                             if failures.get("summary"):
                                 print("\nSummary:")
                                 for line in failures["summary"]:
@@ -163,124 +202,105 @@ class JobCommands(BaseCommand):
         except Exception as e:
             self.output_error(f"Error tailing job {job_id}: {e}", output_format)
 
+    def _report_action(self, output_format, action, job_id, friendly, **fields):
+        """Report a retry/play outcome as JSON fields or friendly lines"""
+        if output_format == "json":
+            self.output_json({"action": action, "job_id": job_id, **fields})
+        else:
+            self.output_lines(friendly)
+
     def handle_job_retry(self, cli, job_id, args, output_format):
         try:
-            job = cli.explorer.project.jobs.get(job_id)
-
-            if job.status not in ["failed", "canceled"]:
-                error_msg = (
-                    f"Job is {job.status}, only failed or canceled jobs can be retried"
+            # The status check needs the current state, not a cached one
+            job = cli.explorer.get_job(job_id, use_cache=False)
+
+            status = job.status
+            if status not in ["failed", "canceled"]:
+                self._report_action(
+                    output_format,
+                    "retry",
+                    job_id,
+                    [
+                        f"⚠️  Job #{job_id} is {status}, only failed or canceled jobs can be retried"
+                    ],
+                    status="error",
+                    error=f"Job is {status}, only failed or canceled jobs can be retried",
                 )
-                if output_format == "json":
-                    self.output_json(
-                        {
-                            "action": "retry",
-                            "job_id": job_id,
-                            "status": "error",
-                            "error": error_msg,
-                        }
-                    )
-                else:
-                    print(
-                        f"⚠️  Job #{job_id} is {job.status}, only failed or canceled jobs can be retried"
-                    )
                 return
 
+            # retry() returns the new job's attributes as a dict
             result = job.retry()
-
-            if output_format == "json":
-                self.output_json(
-                    {
-                        "action": "retry",
-                        "job_id": job_id,
-                        "status": "success",
-                        "new_job": {
-                            "id": result.id if hasattr(result, "id") else job_id,
-                            "status": (
-                                result.status
-                                if hasattr(result, "status")
-                                else "pending"
-                            ),
-                        },
-                    }
-                )
-            else:
-                print(f"✅ Job #{job_id} retry initiated")
-                if hasattr(result, "id") and result.id != job_id:
-                    print(f"New job: #{result.id}")
-                print(
-                    f"Status: {result.status if hasattr(result, 'status') else 'pending'}"
-                )
+            cli.explorer.invalidate_response("job", job_id)
+            new_job_id = result.get("id", job_id)
+            new_status = result.get("status", "pending")
+
+            lines = [f"✅ Job #{job_id} retry initiated"]
+            if new_job_id != job_id:
+                lines.append(f"New job: #{new_job_id}")
+            lines.append(f"Status: {new_status}")
+            self._report_action(
+                output_format,
+                "retry",
+                job_id,
+                lines,
+                status="success",
+                new_job={"id": new_job_id, "status": new_status},
+            )
 
         except Exception as e:
-            if output_format == "json":
-                self.output_json(
-                    {
-                        "action": "retry",
-                        "job_id": job_id,
-                        "status": "error",
-                        "error": str(e),
-                    }
-                )
-            else:
-                print(f"❌ Error retrying job {job_id}: {e}")
+            self._report_action(
+                output_format,
+                "retry",
+                job_id,
+                [f"❌ Error retrying job {job_id}: {e}"],
+                status="error",
+                error=str(e),
+            )
             sys.exit(1)
 
     def handle_job_play(self, cli, job_id, args, output_format):
         try:
-            job = cli.explorer.project.jobs.get(job_id)
-
-            if not hasattr(job, "status") or job.status != "manual":
-                error_msg = f"Job is {job.status if hasattr(job, 'status') else 'unknown'}, only manual jobs can be played"
-                if output_format == "json":
-                    self.output_json(
-                        {
-                            "action": "play",
-                            "job_id": job_id,
-                            "status": "error",
-                            "error": error_msg,
-                        }
-                    )
-                else:
-                    print(
-                        f"⚠️  Job #{job_id} is {job.status if hasattr(job, 'status') else 'unknown'}, only manual jobs can be played"
-                    )
+            # The status check needs the current state, not a cached one
+            job = cli.explorer.get_job(job_id, use_cache=False)
+
+            status = getattr(job, "status", "unknown")
+            if status != "manual":
+                self._report_action(
+                    output_format,
+                    "play",
+                    job_id,
+                    [f"⚠️  Job #{job_id} is {status}, only manual jobs can be played"],
+                    status="error",
+                    error=f"Job is {status}, only manual jobs can be played",
+                )
                 return
 
-            result = job.play()
-
-            if output_format == "json":
-                self.output_json(
-                    {
-                        "action": "play",
-                        "job_id": job_id,
-                        "status": "success",
-                        "job_status": (
-                            result.status if hasattr(result, "status") else "pending"
-                        ),
-                    }
-                )
-            else:
-                print(f"✅ Job #{job_id} triggered")
-                print(
-                    f"Status: {result.status if hasattr(result, 'status') else 'pending'}"
-                )
+            # play() updates the job in place from the server's response
+            job.play()
+            cli.explorer.invalidate_response("job", job_id)
+            job_status = getattr(job, "status", "pending")
+
+            self._report_action(
+                output_format,
+                "play",
+                job_id,
+                [f"✅ Job #{job_id} triggered", f"Status: {job_status}"],
+                status="success",
+                job_status=job_status,
+            )
 
         except Exception as e:
-            if output_format == "json":
-                self.output_json(
-                    {
-                        "action": "play",
-                        "job_id": job_id,
-                        "status": "error",
-                        "error": str(e),
-                    }
-                )
-            else:
-                print(f"❌ Error playing job {job_id}: {e}")
+            self._report_action(
+                output_format,
+                "play",
+                job_id,
+                [f"❌ Error playing job {job_id}: {e}"],
+                status="error",
+                error=str(e),
+            )
             sys.exit(1)
 
-    def _display_job_summary(self, cli, job, job_id, args, total_jobs):
+    def _display_job_summary(self, cli, job, job_id, args, details=None):
 
         is_allowed_failure = (
             getattr(job, "allow_failure", False) and job.status == "failed"
@@ -290,12 +310,7 @@ class JobCommands(BaseCommand):
             status_icon = "⚠️"
             status_display = f"{job.status} (allowed)"
         else:
-            status_icon = {
-                "success": "✅",
-                "failed": "❌",
-                "running": "🔄",
-                "skipped": "⏭",
-            }.get(job.status, "⏸")
+            status_icon = STATUS_TABLE.get(job.status, STATUS_DEFAULT)[0]
             status_display = job.status
 
         print(f"\nJob {job.id}: {job.name}")
@@ -304,7 +319,8 @@ class JobCommands(BaseCommand):
         )
 
         if args.failures and job.status == "failed":
-            details = cli.explorer.get_failed_job_details(job_id)
+            if details is None:
+                details = cli.explorer.get_failed_job_details(job_id)
             failures = details.get("failures", {})
             if failures.get("short_summary"):
                 print("\nFailure Summary:")
@@ -312,25 +328,25 @@ class JobCommands(BaseCommand):
                     if "FAILED" in line:
                         print(f"  • {line.strip()}")
 
-        if total_jobs > 1:
-            print("-" * 60)
-
     def _display_jobs_table(self, all_jobs):
-        print("\nJobs Summary")
-        print("-" * 100)
-        print(f"{'ID':<12} {'Status':<10} {'Stage':<15} {'Duration':<10} {'Name':<50}")
-        print("-" * 100)
+        out = ["\nJobs Summary"]
+        out.append("-" * 100)
+        out.append(JOB_ROW_FORMAT("ID", "Status", "Stage", "Duration", "Name"))
+        out.append("-" * 100)
         for job_info in all_jobs:
-            name = (
-                job_info["name"][:47] + "..."
-                if len(job_info["name"]) > 50
-                else job_info["name"]
-            )
+            name = truncate(job_info["name"])
             status_display = job_info["status"].upper()[:10]
-            print(
-                f"{job_info['id']:<12} {status_display:<10} {job_info['stage']:<15} {job_info['duration']:<10} {name:<50}"
+            out.append(
+                JOB_ROW_FORMAT(
+                    job_info["id"],
+                    status_display,
+                    job_info["stage"],
+                    job_info["duration"],
+                    name,
+                )
             )
-        print("-" * 100)
+        out.append("-" * 100)
+        self.output_lines(out)
 
     def _build_job_detail_json(self, cli, job, job_id):
         output = {
@@ -348,7 +364,8 @@ class JobCommands(BaseCommand):
             "coverage": getattr(job, "coverage", None),
             "allow_failure": job.allow_failure,
             "web_url": job.web_url,
-            "artifacts": getattr(job, "artifacts", None),
+            # ProjectJob.artifacts is a download method, read the raw attribute
+            "artifacts": job.attributes.get("artifacts"),
             "artifacts_expire_at": getattr(job, "artifacts_expire_at", None),
         }
         runner_info = getattr(job, "runner", None)
@@ -386,9 +403,7 @@ class JobCommands(BaseCommand):
             output["user"] = None
         if job.status == "failed":
             details = cli.explorer.get_failed_job_details(job_id)
-            output["failure_reason"] = (
-                job.failure_reason if hasattr(job, "failure_reason") else None
-            )
+            output["failure_reason"] = getattr(job, "failure_reason", None)
             output["failures"] = details.get("failures", {})
 
         return output
@@ -398,8 +413,9 @@ class JobCommands(BaseCommand):
 
         try:
 
-            if hasattr(job, "needs") and job.needs:
-                for need in job.needs:
+            needs = getattr(job, "needs", None)
+            if needs:
+                for need in needs:
                     if isinstance(need, dict):
                         dependencies["needs"].append(
                             {
@@ -411,19 +427,21 @@ class JobCommands(BaseCommand):
                         dependencies["needs"].append(
                             {"name": str(need), "artifacts": True}
                         )
-            if hasattr(job, "pipeline") and job.pipeline:
+            pipeline_info = getattr(job, "pipeline", None)
+            if pipeline_info:
                 pipeline_id = (
-                    job.pipeline.get("id")
-                    if isinstance(job.pipeline, dict)
-                    else job.pipeline.id
+                    pipeline_info.get("id")
+                    if isinstance(pipeline_info, dict)
+                    else pipeline_info.id
                 )
                 all_jobs = cli.explorer.project.pipelines.get(pipeline_id).jobs.list(
                     all=True
                 )
 
                 for other_job in all_jobs:
-                    if hasattr(other_job, "needs") and other_job.needs:
-                        for need in other_job.needs:
+                    other_needs = getattr(other_job, "needs", None)
+                    if other_needs:
+                        for need in other_needs:
                             need_name = (
                                 need.get("name")
                                 if isinstance(need, dict)
@@ -452,148 +470,134 @@ class JobCommands(BaseCommand):
             status_icon = "⚠️"
             status_display = f"{job.status.upper()} (ALLOWED TO FAIL)"
         else:
-            status_icon = {
-                "success": "✅",
-                "failed": "❌",
-                "running": "🔄",
-                "skipped": "⏭",
-                "manual": "🎮",
-                "canceled": "🚫",
-                "pending": "⏳",
-            }.get(job.status, "⏸")
+            status_icon = STATUS_TABLE.get(job.status, STATUS_DEFAULT)[0]
             status_display = job.status.upper()
 
-        print(f"\n{'='*60}")
-        print(f"Job Details: {job.name} (#{job.id})")
-        print(f"{'='*60}")
-        print(f"Status: {status_icon} {status_display}")
-        print(f"Stage: {job.stage}")
-        print(f"Ref: {job.ref}")
+        out = ["\n" + "=" * 60]
+        out.append(f"Job Details: {job.name} (#{job.id})")
+        out.append("=" * 60)
+        out.append(f"Status: {status_icon} {status_display}")
+        out.append(f"Stage: {job.stage}")
+        out.append(f"Ref: {job.ref}")
 
-        if hasattr(job, "tag") and job.tag:
-            print(f"Tag: {job.tag}")
+        tag = getattr(job, "tag", None)
+        if tag:
+            out.append(f"Tag: {tag}")
 
-        print(f"Duration: {cli.explorer.format_duration(job.duration)}")
+        out.append(f"Duration: {cli.explorer.format_duration(job.duration)}")
 
-        if hasattr(job, "queued_duration") and job.queued_duration:
-            print(
-                f"Queued Duration: {cli.explorer.format_duration(job.queued_duration)}"
-            )
+        queued = getattr(job, "queued_duration", None)
+        if queued:
+            out.append(f"Queued Duration: {cli.explorer.format_duration(queued)}")
 
-        print(f"Created: {job.created_at}")
+        out.append(f"Created: {job.created_at}")
 
         if job.started_at:
-            print(f"Started: {job.started_at}")
+            out.append(f"Started: {job.started_at}")
 
         if job.finished_at:
-            print(f"Finished: {job.finished_at}")
+            out.append(f"Finished: {job.finished_at}")
 
-        print(f"\nJOB_URL: {job.web_url}")
-        print(f"JOB_ID: {job.id}")
+        out.append(f"\nJOB_URL: {job.web_url}")
+        out.append(f"JOB_ID: {job.id}")
         pipeline_info = getattr(job, "pipeline", None)
         if pipeline_info and isinstance(pipeline_info, dict):
-            print(
+            out.append(
                 f"\nPipeline: #{pipeline_info.get('id')} ({pipeline_info.get('status')})"
             )
-            print(f"Pipeline Ref: {pipeline_info.get('ref')}")
-            print(f"Pipeline SHA: {pipeline_info.get('sha', '')[:8]}...")
+            out.append(f"Pipeline Ref: {pipeline_info.get('ref')}")
+            out.append(f"Pipeline SHA: {pipeline_info.get('sha', '')[:8]}...")
         runner_info = getattr(job, "runner", None)
         if runner_info:
             if callable(runner_info):
                 runner_info = runner_info()
             if runner_info and isinstance(runner_info, dict):
-                print(
+                out.append(
                     f"\nRunner: #{runner_info.get('id')} - {runner_info.get('description', 'N/A')}"
                 )
-                print(f"Active: {runner_info.get('active', 'Unknown')}")
-                print(f"Shared: {runner_info.get('is_shared', 'Unknown')}")
+                out.append(f"Active: {runner_info.get('active', 'Unknown')}")
+                out.append(f"Shared: {runner_info.get('is_shared', 'Unknown')}")
         user_info = getattr(job, "user", None)
         if user_info and isinstance(user_info, dict):
-            print(f"\nUser: {user_info.get('username')} ({user_info.get('name')})")
-        artifacts = getattr(job, "artifacts", None)
+            out.append(f"\nUser: {user_info.get('username')} ({user_info.get('name')})")
+        # ProjectJob.artifacts is a download method, read the raw attribute
+        artifacts = job.attributes.get("artifacts")
         if artifacts:
-            print(f"\nArtifacts: Available")
+            out.append(f"\nArtifacts: Available")
             artifacts_expire_at = getattr(job, "artifacts_expire_at", None)
             if artifacts_expire_at:
-                print(f"Artifacts Expire: {artifacts_expire_at}")
+                out.append(f"Artifacts Expire: {artifacts_expire_at}")
         coverage = getattr(job, "coverage", None)
         if coverage:
-            print(f"Coverage: {coverage}%")
+            out.append(f"Coverage: {coverage}%")
         if job.status == "failed":
-            print(f"\n{'='*60}")
-            print("FAILURE DETAILS")
-            print(f"{'='*60}")
+            out.append("\n" + "=" * 60)
+            out.append("FAILURE DETAILS")
+            out.append("=" * 60)
 
             failure_reason = getattr(job, "failure_reason", None)
             if failure_reason:
-                print(f"Failure Reason: {failure_reason}")
+                out.append(f"Failure Reason: {failure_reason}")
             details = cli.explorer.get_failed_job_details(job_id)
             failures = details.get("failures", {})
 
             if failures.get("short_summary"):
-                print("\nFailure Summary:")
-                print("-" * 40)
-                print(failures["short_summary"])
+                out.append("\nFailure Summary:")
+                out.append("-" * 40)
+                out.append(failures["short_summary"])
 
             if failures.get("error_types"):
-                print(f"\nError Types: {', '.join(failures['error_types'])}")
+                out.append(f"\nError Types: {', '.join(failures['error_types'])}")
 
             if failures.get("failed_tests"):
-                print(f"\nFailed Tests: {failures['failed_tests']}")
+                out.append(f"\nFailed Tests: {failures['failed_tests']}")
         if dependencies:
             has_deps = bool(dependencies.get("needs") or dependencies.get("needed_by"))
             if has_deps:
-                print(f"\n{'='*60}")
-                print("JOB DEPENDENCIES")
-                print(f"{'='*60}")
+                out.append("\n" + "=" * 60)
+                out.append("JOB DEPENDENCIES")
+                out.append("=" * 60)
                 if dependencies.get("needs"):
-                    print("\n🔼 This job depends on (needs):")
+                    out.append("\n🔼 This job depends on (needs):")
                     for need in dependencies["needs"]:
                         artifacts_str = (
                             " (with artifacts)"
                             if need.get("artifacts")
                             else " (no artifacts)"
                         )
-                        print(f"  • {need['name']}{artifacts_str}")
+                        out.append(f"  • {need['name']}{artifacts_str}")
                 if dependencies.get("needed_by"):
-                    print("\n🔽 Jobs that depend on this job:")
+                    out.append("\n🔽 Jobs that depend on this job:")
                     for dependent in dependencies["needed_by"]:
-                        status_icon = {
-                            "success": "✅",
-                            "failed": "❌",
-                            "running": "🔄",
-                            "skipped": "⏭",
-                            "manual": "🎮",
-                            "canceled": "🚫",
-                            "pending": "⏳",
-                        }.get(dependent["status"], "⏸")
-                        print(
-                            f"  • {dependent['name']} (#{dependent['id']}) {status_icon} {dependent['status']}"
+                        status = dependent["status"]
+                        status_icon, _, _ = STATUS_TABLE.get(status, STATUS_DEFAULT)
+                        out.append(
+                            f"  • {dependent['name']} (#{dependent['id']}) {status_icon} {status}"
                         )
 
-        print(f"\n{'='*60}")
+        out.append("\n" + "=" * 60)
+        self.output_lines(out)
 
     def _display_job_logs_friendly(self, cli, job, job_id, trace):
-        print(f"\n{'='*60}")
-        print(f"Job Logs: {job.name} (#{job_id})")
-        print(f"Status: {job.status.upper()}")
-        print(f"{'='*60}\n")
+        out = ["\n" + "=" * 60]
+        out.append(f"Job Logs: {job.name} (#{job_id})")
+        out.append(f"Status: {job.status.upper()}")
+        out.append("=" * 60 + "\n")
 
         if job.status == "failed":
             failures = cli.explorer.extract_failures_from_trace(trace, job.name)
 
             if failures.get("short_summary"):
-                print("📋 Extracted Failures:")
-                print("-" * 40)
-                print(failures["short_summary"])
-                print("-" * 40)
-                print()
-
-                print("Full job trace follows...\n")
-                print("=" * 60)
-
-        print(trace)
-
-        print(f"\n{'='*60}")
-        print(f"End of logs for job #{job_id}")
-
+                out.append("📋 Extracted Failures:")
+                out.append("-" * 40)
+                out.append(failures["short_summary"])
+                out.append("-" * 40)
+                out.append("")
+
+                out.append("Full job trace follows...\n")
+                out.append("=" * 60)
+
+        # The trace can be megabytes, so write it as-is rather than joining it
+        self.output_lines(out)
+        sys.stdout.write(trace)
+        sys.stdout.write("\n\n" + "=" * 60 + f"\nEnd of logs for job #{job_id}\n")
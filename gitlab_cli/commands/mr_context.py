@@ -4,9 +4,8 @@
 
 """MR context commands - show MR info and related resources with diff support"""
 
-import json
 import re
-from .base import BaseCommand
+from .base import BaseCommand, FORMAT_CHOICES, DIFF_VIEW_CHOICES
 
 
 class MRContextCommand(BaseCommand):
@@ -23,7 +22,7 @@ class MRContextCommand(BaseCommand):
 
         parser.add_argument(
             "--view",
-            choices=["inline", "split", "unified"],
+            choices=DIFF_VIEW_CHOICES,
             help="Diff view mode (inline, split, unified)",
         )
         parser.add_argument(
@@ -49,9 +48,7 @@ class MRContextCommand(BaseCommand):
             default=20,
             help="Limit number of results (default: 20)",
         )
-        parser.add_argument(
-            "--format", choices=["friendly", "table", "json"], help="Output format"
-        )
+        parser.add_argument("--format", choices=FORMAT_CHOICES, help="Output format")
 
     def get_diff_view_preference(self, cli, args):
         if args.view:
@@ -119,7 +116,7 @@ class MRContextCommand(BaseCommand):
                         "approvals_required": approvals.approvals_required,
                         "approvals_left": approvals.approvals_left,
                     }
-                print(json.dumps(output, indent=2))
+                self.output_json(output)
             else:
                 # Friendly output
                 print(f"\n{'='*80}")
@@ -434,7 +431,7 @@ class MRContextCommand(BaseCommand):
                     }
                     for p in pipelines
                 ]
-                print(json.dumps({"pipelines": pipeline_data}, indent=2))
+                self.output_json({"pipelines": pipeline_data})
             else:
                 if len(pipelines) < args.limit:
                     print(
@@ -483,7 +480,7 @@ class MRContextCommand(BaseCommand):
                         for c in commits
                     ]
                 }
-                print(json.dumps(output, indent=2))
+                self.output_json(output)
             else:
                 print(f"\nCommits in MR !{mr.iid}:")
                 print("-" * 80)
@@ -523,7 +520,7 @@ class MRContextCommand(BaseCommand):
                         for d in discussions
                     ]
                 }
-                print(json.dumps(output, indent=2))
+                self.output_json(output)
             else:
                 print(f"\nDiscussions in MR !{mr.iid}:")
                 print("-" * 80)
@@ -542,5 +539,7 @@ class MRContextCommand(BaseCommand):
             print(f"Error fetching discussions for MR {mr_id}: {e}")
 
     def handle_mr_approval(self, cli, mr_id, args, output_format):
+        # Approving changes the MR, so drop its cached GET for later views
+        cli.explorer.invalidate_response("mr", mr_id)
         print(f"Approval handling for MR {mr_id} - to be implemented")
 
@@ -4,8 +4,50 @@
 
 """Merge Requests command handler"""
 
-import json
-from .base import BaseCommand
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from .base import (
+    BaseCommand,
+    FORMAT_CHOICES,
+    MR_STATE_COLORS,
+    STATUS_TABLE,
+    STATUS_DEFAULT,
+    truncate,
+)
+
+# Row layout of the MR table (MR, state, author, target, created, title)
+MR_ROW_FORMAT = "{:<8} {:<10} {:<15} {:<20} {:<12} {:<50}".format
+
+# Colors only for a terminal; piped or redirected output stays plain text
+if sys.stdout.isatty():
+    COLOR_RESET = "\033[0m"
+    PIPELINE_STATUS_COLORS = {status: row[1] for status, row in STATUS_TABLE.items()}
+else:
+    COLOR_RESET = ""
+    MR_STATE_COLORS = dict.fromkeys(MR_STATE_COLORS, "")
+    PIPELINE_STATUS_COLORS = {}
+
+# Optional MR attributes and their defaults, read once per detail view
+MR_OPTIONAL_FIELDS = (
+    ("merged_at", None),
+    ("closed_at", None),
+    ("assignee", None),
+    ("assignees", []),
+    ("reviewers", []),
+    ("merge_user", None),
+    ("merge_status", None),
+    ("draft", False),
+    ("work_in_progress", False),
+    ("merge_when_pipeline_succeeds", False),
+    ("has_conflicts", False),
+    ("blocking_discussions_resolved", None),
+    ("approvals_before_merge", None),
+    ("milestone", None),
+    ("head_pipeline", None),
+    ("additions", 0),
+    ("deletions", 0),
+)
 
 
 class MRsCommand(BaseCommand):
@@ -25,9 +67,7 @@ class MRsCommand(BaseCommand):
             action="store_true",
             help="Show full information including description",
         )
-        parser.add_argument(
-            "--format", choices=["friendly", "table", "json"], help="Output format"
-        )
+        parser.add_argument("--format", choices=FORMAT_CHOICES, help="Output format")
 
     def handle(self, cli, args, output_format, action=None, mr_id=None):
         if action == "detail" and mr_id:
@@ -38,14 +78,21 @@ class MRsCommand(BaseCommand):
 
     def handle_list(self, cli, ids, args, output_format):
         all_mrs = []
-
-        for mr_id in ids:
-            if output_format == "json":
-                self.show_mr_json(cli, mr_id, args)
+        mrs = self.fetch_all(cli.explorer.project.mergerequests.get, ids)
+        separate = len(ids) > 1 and output_format == "friendly"
+
+        for mr_id, mr in zip(ids, mrs):
+            if isinstance(mr, Exception):
+                # Report a failed fetch the way each view reports its errors
+                if output_format == "json":
+                    self.output_json({"error": str(mr)})
+                else:
+                    print(f"Error fetching MR {mr_id}: {mr}")
+            elif output_format == "json":
+                self.show_mr_json(cli, mr_id, args, mr)
             elif output_format == "table":
 
                 try:
-                    mr = cli.explorer.project.mergerequests.get(mr_id)
                     all_mrs.append(
                         {
                             "iid": mr.iid,
@@ -59,86 +106,87 @@ class MRsCommand(BaseCommand):
                 except Exception as e:
                     print(f"Error fetching MR {mr_id}: {e}")
             else:
-                self.show_mr_summary(cli, mr_id, args, output_format)
+                self.show_mr_summary(cli, mr_id, args, output_format, mr)
 
-            if len(ids) > 1 and output_format == "friendly":
+            if separate:
                 print("-" * 80)
 
         if output_format == "table" and all_mrs:
             self.display_table(all_mrs)
 
     def display_table(self, mrs):
-        print("\nMerge Requests")
-        print("-" * 120)
-        print(
-            f"{'MR':<8} {'State':<10} {'Author':<15} {'Target':<20} {'Created':<12} {'Title':<50}"
-        )
-        print("-" * 120)
+        out = ["\nMerge Requests"]
+        out.append("-" * 120)
+        out.append(MR_ROW_FORMAT("MR", "State", "Author", "Target", "Created", "Title"))
+        out.append("-" * 120)
         for mr_info in mrs:
-            title = (
-                mr_info["title"][:47] + "..."
-                if len(mr_info["title"]) > 50
-                else mr_info["title"]
-            )
-            print(
-                f"!{mr_info['iid']:<7} {mr_info['state']:<10} {mr_info['author']:<15} "
-                f"{mr_info['target']:<20} {mr_info['created']:<12} {title:<50}"
+            title = truncate(mr_info["title"])
+            out.append(
+                MR_ROW_FORMAT(
+                    f"!{mr_info['iid']}",
+                    mr_info["state"],
+                    mr_info["author"],
+                    mr_info["target"],
+                    mr_info["created"],
+                    title,
+                )
             )
-        print("-" * 120)
+        out.append("-" * 120)
+        self.output_lines(out)
 
-    def show_mr_summary(self, cli, mr_id, args, output_format):
+    def show_mr_summary(self, cli, mr_id, args, output_format, mr=None):
         try:
-            mr = cli.explorer.project.mergerequests.get(mr_id)
-
-            status_color = {
-                "opened": "\033[92m",  # Green
-                "merged": "\033[94m",  # Blue
-                "closed": "\033[91m",  # Red
-            }.get(mr.state, "")
-
-            print(f"\nMR !{mr.iid}: {mr.title}")
-            print(
-                f"Status: {status_color}{mr.state.upper()}\033[0m | "
-                f"Author: {mr.author['username']} | Target: {mr.target_branch}"
+            if mr is None:
+                mr = cli.explorer.project.mergerequests.get(mr_id)
+
+            # RESTObject attribute access goes through __getattr__, read once
+            state = mr.state
+            author = mr.author["username"]
+            created = mr.created_at[:10]
+            updated = mr.updated_at[:10]
+
+            status_color = MR_STATE_COLORS.get(state, "")
+
+            out = [f"\nMR !{mr.iid}: {mr.title}"]
+            out.append(
+                f"Status: {status_color}{state.upper()}{COLOR_RESET} | "
+                f"Author: {author} | Target: {mr.target_branch}"
             )
-            print(f"Created: {mr.created_at[:10]} | Updated: {mr.updated_at[:10]}")
+            out.append(f"Created: {created} | Updated: {updated}")
 
             # Pipeline status if available
-            if hasattr(mr, "head_pipeline") and mr.head_pipeline:
-                p_status = mr.head_pipeline.get("status", "unknown")
-                p_color = {
-                    "success": "\033[92m",
-                    "failed": "\033[91m",
-                    "running": "\033[93m",
-                }.get(p_status, "")
-                print(
-                    f"Pipeline: {p_color} {p_status}\033[0m (ID: {mr.head_pipeline.get('id')})"
+            head_pipeline = getattr(mr, "head_pipeline", None)
+            if head_pipeline:
+                p_status = head_pipeline.get("status", "unknown")
+                p_color = PIPELINE_STATUS_COLORS.get(p_status, "")
+                out.append(
+                    f"Pipeline: {p_color} {p_status}{COLOR_RESET} (ID: {head_pipeline.get('id')})"
                 )
 
-            if args.pipelines:
+            # --pipelines/--full only exist on the legacy parser
+            if getattr(args, "pipelines", False):
 
-                pipelines = cli.explorer.get_pipelines_for_mr(mr_id)[:5]
+                pipelines = cli.explorer.get_pipelines_for_mr(mr_id, mr)[:5]
                 if pipelines:
-                    print("\nRecent Pipelines:")
+                    out.append("\nRecent Pipelines:")
                     for p in pipelines:
-                        status_icon = {
-                            "success": "[SUCCESS]",
-                            "failed": "[FAILED]",
-                            "running": "[RUNNING]",
-                        }.get(p["status"], "[PENDING]")
-                        print(
+                        status_icon = STATUS_TABLE.get(p["status"], STATUS_DEFAULT)[2]
+                        out.append(
                             f"  {status_icon} {p['id']} - {p['status']} ({p['created_at'][:16]})"
                         )
 
-            if args.full and mr.description:
-                print(f"\nDescription:\n{mr.description[:500]}...")
+            if getattr(args, "full", False) and mr.description:
+                out.append(f"\nDescription:\n{mr.description[:500]}...")
+
+            self.output_lines(out)
 
         except Exception as e:
             print(f"Error fetching MR {mr_id}: {e}")
 
-    def show_mr_json(self, cli, mr_id, args):
+    def show_mr_json(self, cli, mr_id, args, mr=None):
         try:
-            mr = cli.explorer.project.mergerequests.get(mr_id)
+            if mr is None:
+                mr = cli.explorer.project.mergerequests.get(mr_id)
             output = {
                 "id": mr.id,
                 "iid": mr.iid,
@@ -152,21 +200,29 @@ class MRsCommand(BaseCommand):
                 "web_url": mr.web_url,
             }
 
-            if hasattr(mr, "head_pipeline") and mr.head_pipeline:
-                output["pipeline"] = mr.head_pipeline
+            head_pipeline = getattr(mr, "head_pipeline", None)
+            if head_pipeline:
+                output["pipeline"] = head_pipeline
 
-            if args.pipelines:
-                output["recent_pipelines"] = cli.explorer.get_pipelines_for_mr(mr_id)[
-                    :10
-                ]
+            if getattr(args, "pipelines", False):
+                output["recent_pipelines"] = cli.explorer.get_pipelines_for_mr(
+                    mr_id, mr
+                )[:10]
 
-            print(json.dumps(output, indent=2))
+            self.output_json(output)
         except Exception as e:
-            print(json.dumps({"error": str(e)}))
+            self.output_json({"error": str(e)})
 
     def handle_detail(self, cli, mr_id, args, output_format):
         try:
-            mr = cli.explorer.project.mergerequests.get(mr_id)
+            # Overlap the pipeline listing with the MR fetch; it is memoized
+            # on the explorer, so the views below reuse it. A failure stays
+            # quiet here and is reported by the views' own call.
+            with ThreadPoolExecutor(max_workers=1) as ex:
+                ex.submit(cli.explorer.get_pipelines_for_mr, mr_id, quiet=True)
+                mr = cli.explorer.get_merge_request(
+                    mr_id, use_cache=not getattr(args, "no_cache", False)
+                )
 
             if output_format == "json":
                 self.show_detail_json(cli, mr, mr_id)
@@ -176,7 +232,16 @@ class MRsCommand(BaseCommand):
         except Exception as e:
             self.output_error(f"Error fetching MR {mr_id} details: {e}", output_format)
 
+    def _optional_fields(self, mr):
+        """Map each MR_OPTIONAL_FIELDS name to its value or default"""
+        return {
+            name: getattr(mr, name, default) for name, default in MR_OPTIONAL_FIELDS
+        }
+
     def show_detail_json(self, cli, mr, mr_id):
+        fields = self._optional_fields(mr)
+        additions = fields["additions"]
+        deletions = fields["deletions"]
         output = {
             "id": mr.id,
             "iid": mr.iid,
@@ -185,152 +250,148 @@ class MRsCommand(BaseCommand):
             "state": mr.state,
             "created_at": mr.created_at,
             "updated_at": mr.updated_at,
-            "merged_at": getattr(mr, "merged_at", None),
-            "closed_at": getattr(mr, "closed_at", None),
+            "merged_at": fields["merged_at"],
+            "closed_at": fields["closed_at"],
             "source_branch": mr.source_branch,
             "target_branch": mr.target_branch,
             "author": {
                 "username": mr.author["username"],
                 "name": mr.author["name"],
             },
-            "assignee": getattr(mr, "assignee", None),
-            "assignees": getattr(mr, "assignees", []),
-            "reviewers": getattr(mr, "reviewers", []),
-            "merge_user": getattr(mr, "merge_user", None),
-            "merge_status": getattr(mr, "merge_status", None),
-            "draft": getattr(mr, "draft", False),
-            "work_in_progress": getattr(mr, "work_in_progress", False),
-            "merge_when_pipeline_succeeds": getattr(
-                mr, "merge_when_pipeline_succeeds", False
-            ),
-            "has_conflicts": getattr(mr, "has_conflicts", False),
-            "blocking_discussions_resolved": getattr(
-                mr, "blocking_discussions_resolved", True
-            ),
-            "approvals_before_merge": getattr(mr, "approvals_before_merge", None),
+            "assignee": fields["assignee"],
+            "assignees": fields["assignees"],
+            "reviewers": fields["reviewers"],
+            "merge_user": fields["merge_user"],
+            "merge_status": fields["merge_status"],
+            "draft": fields["draft"],
+            "work_in_progress": fields["work_in_progress"],
+            "merge_when_pipeline_succeeds": fields["merge_when_pipeline_succeeds"],
+            "has_conflicts": fields["has_conflicts"],
+            "blocking_discussions_resolved": fields["blocking_discussions_resolved"],
+            "approvals_before_merge": fields["approvals_before_merge"],
             "reference": mr.reference,
             "web_url": mr.web_url,
             "labels": mr.labels,
-            "milestone": getattr(mr, "milestone", None),
-            "head_pipeline": getattr(mr, "head_pipeline", None),
+            "milestone": fields["milestone"],
+            "head_pipeline": fields["head_pipeline"],
             "diff_stats": {
-                "additions": getattr(mr, "additions", 0),
-                "deletions": getattr(mr, "deletions", 0),
-                "total": getattr(mr, "additions", 0) + getattr(mr, "deletions", 0),
+                "additions": additions,
+                "deletions": deletions,
+                "total": additions + deletions,
             },
         }
-        pipelines = cli.explorer.get_pipelines_for_mr(mr_id)[:5]
+        pipelines = cli.explorer.get_pipelines_for_mr(mr_id, mr)[:5]
         if pipelines:
             output["recent_pipelines"] = pipelines
 
-        print(json.dumps(output, indent=2))
+        self.output_json(output)
 
     def show_detail_friendly(self, cli, mr, mr_id):
-        status_color = {
-            "opened": "\033[92m",  # Green
-            "merged": "\033[94m",  # Blue
-            "closed": "\033[91m",  # Red
-        }.get(mr.state, "")
-
-        print(f"\n{'='*60}")
-        print(f"MR !{mr.iid}: {mr.title}")
-        print(f"{'='*60}\n")
-
-        print(f"Status:       {status_color}{mr.state.upper()}\033[0m")
-        if getattr(mr, "draft", False):
-            print(f"              DRAFT")
-
-        print(f"Author:       {mr.author['name']} (@{mr.author['username']})")
-
-        if getattr(mr, "assignees", None):
-            assignee_names = [f"@{a['username']}" for a in mr.assignees]
-            print(f"Assignees:    {', '.join(assignee_names)}")
-
-        if getattr(mr, "reviewers", None):
-            reviewer_names = [f"@{r['username']}" for r in mr.reviewers]
-            print(f"Reviewers:    {', '.join(reviewer_names)}")
-
-        print(f"\nBranches:")
-        print(f"  Source:     {mr.source_branch}")
-        print(f"  Target:     {mr.target_branch}")
-
-        print(f"\nTiming:")
-        print(f"  Created:    {mr.created_at}")
-        print(f"  Updated:    {mr.updated_at}")
-
-        if getattr(mr, "merged_at", None):
-            print(f"  Merged:     {mr.merged_at}")
-            if getattr(mr, "merge_user", None):
-                print(f"  Merged by:  @{mr.merge_user['username']}")
-        elif getattr(mr, "closed_at", None):
-            print(f"  Closed:     {mr.closed_at}")
+        state = mr.state
+        author = mr.author
+        description = mr.description
+        fields = self._optional_fields(mr)
+        status_color = MR_STATE_COLORS.get(state, "")
+
+        out = [f"\n{'='*60}"]
+        out.append(f"MR !{mr.iid}: {mr.title}")
+        out.append(f"{'='*60}\n")
+
+        out.append(f"Status:       {status_color}{state.upper()}{COLOR_RESET}")
+        if fields["draft"]:
+            out.append(f"              DRAFT")
+
+        out.append(f"Author:       {author['name']} (@{author['username']})")
+
+        assignees = fields["assignees"]
+        if assignees:
+            names = ", ".join([f"@{a['username']}" for a in assignees])
+            out.append(f"Assignees:    {names}")
+
+        reviewers = fields["reviewers"]
+        if reviewers:
+            names = ", ".join([f"@{r['username']}" for r in reviewers])
+            out.append(f"Reviewers:    {names}")
+
+        out.append(f"\nBranches:")
+        out.append(f"  Source:     {mr.source_branch}")
+        out.append(f"  Target:     {mr.target_branch}")
+
+        out.append(f"\nTiming:")
+        out.append(f"  Created:    {mr.created_at}")
+        out.append(f"  Updated:    {mr.updated_at}")
+
+        if fields["merged_at"]:
+            out.append(f"  Merged:     {fields['merged_at']}")
+            if fields["merge_user"]:
+                out.append(f"  Merged by:  @{fields['merge_user']['username']}")
+        elif fields["closed_at"]:
+            out.append(f"  Closed:     {fields['closed_at']}")
 
         # Merge status for open MRs
-        if mr.state == "opened":
-            print(f"\nMerge Status:")
-            if getattr(mr, "has_conflicts", False):
-                print(f"  Has conflicts")
-            if getattr(mr, "work_in_progress", False):
-                print(f"  Work in progress")
-            if getattr(mr, "merge_when_pipeline_succeeds", False):
-                print(f"  Set to merge when pipeline succeeds")
-            if hasattr(mr, "blocking_discussions_resolved"):
-                if mr.blocking_discussions_resolved:
-                    print(f"  All discussions resolved")
+        if state == "opened":
+            out.append(f"\nMerge Status:")
+            if fields["has_conflicts"]:
+                out.append(f"  Has conflicts")
+            if fields["work_in_progress"]:
+                out.append(f"  Work in progress")
+            if fields["merge_when_pipeline_succeeds"]:
+                out.append(f"  Set to merge when pipeline succeeds")
+            # Older GitLab versions omit the field; say nothing rather than guess
+            resolved = fields["blocking_discussions_resolved"]
+            if resolved is not None:
+                if resolved:
+                    out.append(f"  All discussions resolved")
                 else:
-                    print(f"  Unresolved discussions")
+                    out.append(f"  Unresolved discussions")
 
         # Diff stats
-        if hasattr(mr, "additions") or hasattr(mr, "deletions"):
-            additions = getattr(mr, "additions", 0)
-            deletions = getattr(mr, "deletions", 0)
-            print(f"\nChanges:")
-            print(f"  Additions:  +{additions}")
-            print(f"  Deletions:  -{deletions}")
-            print(f"  Total:      {additions + deletions} lines")
+        additions = fields["additions"]
+        deletions = fields["deletions"]
+        if additions or deletions:
+            out.append(f"\nChanges:")
+            out.append(f"  Additions:  +{additions}")
+            out.append(f"  Deletions:  -{deletions}")
+            out.append(f"  Total:      {additions + deletions} lines")
 
         # Pipeline status
-        if getattr(mr, "head_pipeline", None):
-            p = mr.head_pipeline
+        p = fields["head_pipeline"]
+        if p:
             p_status = p.get("status", "unknown")
-            p_color = {
-                "success": "\033[92m",
-                "failed": "\033[91m",
-                "running": "\033[93m",
-            }.get(p_status, "")
-            print(f"\nCurrent Pipeline:")
-            print(f"  {p_color} {p_status}\033[0m (ID: {p.get('id')})")
-            print(f"  SHA: {p.get('sha', '')[:8]}")
+            p_color = PIPELINE_STATUS_COLORS.get(p_status, "")
+            out.append(f"\nCurrent Pipeline:")
+            out.append(f"  {p_color} {p_status}{COLOR_RESET} (ID: {p.get('id')})")
+            # "sha" may be present but null on pipelines still being created
+            sha = p.get("sha")
+            out.append(f"  SHA: {sha[:8] if sha else ''}")
 
         # Recent pipelines
-        pipelines = cli.explorer.get_pipelines_for_mr(mr_id)[:5]
+        pipelines = cli.explorer.get_pipelines_for_mr(mr_id, mr)[:5]
         if pipelines:
-            print(f"\nRecent Pipelines:")
+            out.append(f"\nRecent Pipelines:")
             for p in pipelines:
-                status_icon = {
-                    "success": "[SUCCESS]",
-                    "failed": "[FAILED]",
-                    "running": "[RUNNING]",
-                }.get(p["status"], "[PENDING]")
-                print(
+                status_icon = STATUS_TABLE.get(p["status"], STATUS_DEFAULT)[2]
+                out.append(
                     f"  {status_icon} {p['id']} - {p['status']} ({p['created_at'][:16]})"
                 )
 
         # Labels and milestone
         if mr.labels:
-            print(f"\nLabels: {', '.join(mr.labels)}")
+            out.append(f"\nLabels: {', '.join(mr.labels)}")
 
-        if getattr(mr, "milestone", None):
-            print(f"Milestone: {mr.milestone['title']}")
+        if fields["milestone"]:
+            out.append(f"Milestone: {fields['milestone']['title']}")
 
         # Description preview
-        if mr.description:
-            print(f"\nDescription (preview):")
-            desc_lines = mr.description.split("\n")[:5]
-            for line in desc_lines:
-                print(f"  {line[:80]}")
-            if len(mr.description.split("\n")) > 5:
-                print(f"  ... (truncated)")
-
-        print(f"\nMR_URL: {mr.web_url}")
+        if description:
+            out.append(f"\nDescription (preview):")
+            # maxsplit stops scanning once a sixth line proves truncation
+            desc_lines = description.split("\n", 5)
+            for line in desc_lines[:5]:
+                out.append(f"  {line[:80]}")
+            if len(desc_lines) > 5:
+                out.append(f"  ... (truncated)")
+
+        out.append(f"\nMR_URL: {mr.web_url}")
+        self.output_lines(out)
 
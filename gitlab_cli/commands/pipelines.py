@@ -4,11 +4,52 @@
 
 """Pipeline command handlers for GitLab CLI"""
 
+import re
 import sys
-import json
 import time
 from collections import defaultdict
-from .base import BaseCommand
+from concurrent.futures import ThreadPoolExecutor
+from .base import (
+    BaseCommand,
+    JOB_ROW_FORMAT,
+    PIPELINE_STATUS_CHOICES,
+    PIPELINE_SOURCE_CHOICES,
+    STATUS_TABLE,
+    STATUS_DEFAULT,
+    STATUS_LABELS,
+    exit_now,
+    truncate,
+)
+
+# (label, summary key) rows of the job statistics tables, in display order
+JOB_COUNT_ROWS = (
+    ("Success", "success"),
+    ("Failed", "failed"),
+    ("Running", "running"),
+    ("Skipped", "skipped"),
+    ("Pending", "pending"),
+)
+
+# Row layouts of the job statistics (status, count) and failed-job tables
+COUNT_ROW_FORMAT = "{:<15} {:>10}".format
+FAILED_JOB_ROW_FORMAT = "{:<12} {:<15} {:<50}".format
+
+# Sentinel for getattr() where a present-but-None attribute is meaningful
+_MISSING = object()
+
+# Stage status is the first of these with a non-zero count in the stage
+STAGE_STATUS_ORDER = ("failed", "running", "pending", "success", "skipped")
+
+# Pipeline statuses a cancel request cannot change
+FINISHED_STATUSES = ("success", "failed", "canceled", "skipped")
+
+# Job status filter flags on the pipeline parser (--failed, --running, ...)
+JOB_STATUS_FLAGS = ("failed", "running", "success", "skipped")
+
+# "<icon> <STATUS>" display text per pipeline status, built once
+STATUS_LINES = {
+    status: f"{row[0]} {status.upper()}" for status, row in STATUS_TABLE.items()
+}
 
 
 class PipelineCommands(BaseCommand):
@@ -24,7 +65,7 @@ class PipelineCommands(BaseCommand):
         )
         parser.add_argument(
             "--status",
-            choices=["success", "failed", "running", "pending", "canceled", "skipped"],
+            choices=PIPELINE_STATUS_CHOICES,
             help="Filter by pipeline status",
         )
         parser.add_argument("--ref", help="Filter by ref/branch name")
@@ -33,17 +74,7 @@ class PipelineCommands(BaseCommand):
         )
         parser.add_argument(
             "--source",
-            choices=[
-                "push",
-                "web",
-                "trigger",
-                "schedule",
-                "api",
-                "external",
-                "pipeline",
-                "chat",
-                "merge_request_event",
-            ],
+            choices=PIPELINE_SOURCE_CHOICES,
             help="Filter by pipeline source",
         )
         parser.add_argument(
@@ -54,49 +85,69 @@ class PipelineCommands(BaseCommand):
         )
 
     def handle_pipelines(self, cli, ids, args, output_format):
-        status_filter = None
-        if args.failed:
-            status_filter = "failed"
-        elif args.running:
-            status_filter = "running"
-        elif args.success:
-            status_filter = "success"
-        elif args.skipped:
-            status_filter = "skipped"
+        # The status flags are mutually exclusive, so at most one is set
+        status_filter = next(
+            (s for s in JOB_STATUS_FLAGS if getattr(args, s, False)), None
+        )
+
+        # Each pipeline's data is independent, so fetch it all up front: the
+        # full job list for --jobs/status filters, otherwise the summary
+        prefetched = {}
+        if len(ids) > 1 and not args.job_search:
+            if args.jobs or status_filter:
+                fetch = cli.explorer.get_pipeline_details
+            else:
+                fetch = cli.explorer.get_job_status_summary
+            prefetched = dict(
+                zip(
+                    ids,
+                    self.fetch_all(lambda pid: fetch(pid, verbose=cli.verbose), ids),
+                )
+            )
 
+        separate = len(ids) > 1 and output_format != "json"
         for pipeline_id in ids:
-            if args.job_search:
+            # A failed prefetch raises here, as the views' own fetch would
+            data = prefetched.get(pipeline_id)
+            if isinstance(data, Exception):
+                raise data
+
+            if pipeline_id in prefetched and not data:
+                # The prefetch already printed why; don't fetch it again
+                print(f"Could not fetch pipeline {pipeline_id}")
+            elif args.job_search:
                 self.search_pipeline_jobs(
                     cli, pipeline_id, args.job_search, output_format
                 )
             elif args.jobs or status_filter:
                 args.pipeline_id = pipeline_id
                 args.status = status_filter
-                args.format = output_format
-                cli.cmd_pipeline_jobs(args)
+                cli.cmd_pipeline_jobs(args, output_format, data)
             else:
-                self.show_pipeline_summary(cli, pipeline_id, args, output_format)
+                self.show_pipeline_summary(cli, pipeline_id, args, output_format, data)
 
-            if len(ids) > 1 and output_format != "json":
+            if separate:
                 print("-" * 80)
 
     def search_pipeline_jobs(self, cli, pipeline_id, search_pattern, output_format):
         try:
 
             pipeline = cli.explorer.project.pipelines.get(pipeline_id)
-            jobs = pipeline.jobs.list(all=True)
 
-            # Also get bridges (trigger jobs) - these are shown as "Trigger job" in UI
-            try:
-                bridges = pipeline.bridges.list(all=True)
-                all_jobs = list(jobs) + list(bridges)
-            except:
-                # If bridges API is not available, just use regular jobs
-                all_jobs = list(jobs)
-            pattern_lower = search_pattern.lower()
-            matching_jobs = [
-                job for job in all_jobs if pattern_lower in job.name.lower()
-            ]
+            # Also get bridges (trigger jobs) - these are shown as "Trigger job" in UI.
+            # Both listings are independent requests, so issue them together.
+            with ThreadPoolExecutor(max_workers=2) as ex:
+                jobs_future = ex.submit(pipeline.jobs.list, all=True)
+                bridges_future = ex.submit(pipeline.bridges.list, all=True)
+                jobs = jobs_future.result()
+                try:
+                    all_jobs = list(jobs) + list(bridges_future.result())
+                except:
+                    # If bridges API is not available, just use regular jobs
+                    all_jobs = list(jobs)
+            # Case-insensitive substring match, compiled once for all jobs
+            pattern = re.compile(re.escape(search_pattern), re.IGNORECASE)
+            matching_jobs = [job for job in all_jobs if pattern.search(job.name)]
 
             if not matching_jobs:
                 if cli.verbose:
@@ -129,26 +180,29 @@ class PipelineCommands(BaseCommand):
                         for job in matching_jobs
                     ],
                 }
-                print(json.dumps(output, indent=2))
+                self.output_json(output)
             elif output_format == "table":
-                print(f"\nJobs matching '{search_pattern}' in Pipeline {pipeline_id}")
-                print("-" * 100)
-                print(
-                    f"{'ID':<12} {'Status':<10} {'Stage':<15} {'Duration':<10} {'Name':<50}"
-                )
-                print("-" * 100)
+                out = [f"\nJobs matching '{search_pattern}' in Pipeline {pipeline_id}"]
+                out.append("-" * 100)
+                out.append(JOB_ROW_FORMAT("ID", "Status", "Stage", "Duration", "Name"))
+                out.append("-" * 100)
                 for job in matching_jobs:
-                    name = job.name[:47] + "..." if len(job.name) > 50 else job.name
+                    name = truncate(job.name)
                     status_display = job.status.upper()[:10]
                     duration = cli.explorer.format_duration(job.duration)
-                    print(
-                        f"{job.id:<12} {status_display:<10} {job.stage:<15} {duration:<10} {name:<50}"
+                    out.append(
+                        JOB_ROW_FORMAT(
+                            job.id, status_display, job.stage, duration, name
+                        )
                     )
-                print("-" * 100)
-                print(f"Found {len(matching_jobs)} job(s) matching '{search_pattern}'")
+                out.append("-" * 100)
+                out.append(
+                    f"Found {len(matching_jobs)} job(s) matching '{search_pattern}'"
+                )
+                self.output_lines(out)
             else:
-                print(f"\nJobs matching '{search_pattern}' in Pipeline {pipeline_id}:")
-                print("-" * 60)
+                out = [f"\nJobs matching '{search_pattern}' in Pipeline {pipeline_id}:"]
+                out.append("-" * 60)
 
                 for job in matching_jobs:
 
@@ -160,45 +214,42 @@ class PipelineCommands(BaseCommand):
                         status_icon = "⚠️"
                         status_text = f"{job.status} (allowed)"
                     else:
-                        status_icon = {
-                            "success": "✅",
-                            "failed": "❌",
-                            "running": "🔄",
-                            "skipped": "⏭",
-                            "canceled": "⏹",
-                            "manual": "👆",
-                        }.get(job.status, "⏸")
+                        status_icon = STATUS_TABLE.get(job.status, STATUS_DEFAULT)[0]
                         status_text = job.status
-                    job_type = (
-                        " (Trigger job)" if hasattr(job, "downstream_pipeline") else ""
-                    )
+                    # Only bridges carry downstream_pipeline (possibly None)
+                    downstream = getattr(job, "downstream_pipeline", _MISSING)
+                    job_type = " (Trigger job)" if downstream is not _MISSING else ""
 
-                    print(f"\n{status_icon} {job.name}{job_type}")
-                    print(
+                    out.append(f"\n{status_icon} {job.name}{job_type}")
+                    out.append(
                         f"   ID: {job.id} | Status: {status_text} | Stage: {job.stage}"
                     )
 
                     # Duration might not exist for bridges
                     duration = getattr(job, "duration", None)
                     if duration is not None:
-                        print(f"   Duration: {cli.explorer.format_duration(duration)}")
-                    if hasattr(job, "downstream_pipeline") and job.downstream_pipeline:
-                        downstream = job.downstream_pipeline
-                        print(
+                        out.append(
+                            f"   Duration: {cli.explorer.format_duration(duration)}"
+                        )
+                    if downstream and downstream is not _MISSING:
+                        out.append(
                             f"   Triggered Pipeline: #{downstream.get('id')} - {downstream.get('status')}"
                         )
 
                     if job.status == "failed":
-                        print(f"   URL: {job.web_url}")
+                        out.append(f"   URL: {job.web_url}")
 
-                print(
+                out.append(
                     f"\nFound {len(matching_jobs)} job(s) matching '{search_pattern}'"
                 )
+                self.output_lines(out)
 
         except Exception as e:
             print(f"Error searching jobs in pipeline {pipeline_id}: {e}")
 
-    def show_pipeline_summary(self, cli, pipeline_id, args, output_format):
+    def show_pipeline_summary(
+        self, cli, pipeline_id, args, output_format, summary=None
+    ):
 
         if cli.verbose:
             from pathlib import Path
@@ -209,7 +260,10 @@ class PipelineCommands(BaseCommand):
             if cache_path.exists():
                 print(f"   Cache size: {cache_path.stat().st_size:,} bytes")
 
-        summary = cli.explorer.get_job_status_summary(pipeline_id, verbose=cli.verbose)
+        if summary is None:
+            summary = cli.explorer.get_job_status_summary(
+                pipeline_id, verbose=cli.verbose
+            )
 
         if not summary:
             print(f"Could not fetch pipeline {pipeline_id}")
@@ -232,97 +286,116 @@ class PipelineCommands(BaseCommand):
             }
             # Always include stages in JSON output
             output["stages"] = summary["stages"]
-            print(json.dumps(output, indent=2))
-        elif output_format == "table":
-            print(f"\nPipeline {pipeline_id} Summary")
-            print("-" * 60)
-            print(f"{'Status':<15} {summary['pipeline_status'].upper()}")
-            print(f"{'Created':<15} {summary['created_at'][:16]}")
-            print(
+            self.output_json(output)
+            return
+
+        out = []
+        if output_format == "table":
+            out.append(f"\nPipeline {pipeline_id} Summary")
+            out.append("-" * 60)
+            out.append(f"{'Status':<15} {summary['pipeline_status'].upper()}")
+            out.append(f"{'Created':<15} {summary['created_at'][:16]}")
+            out.append(
                 f"{'Duration':<15} {cli.explorer.format_duration(summary['duration'])}"
             )
-            print("-" * 60)
-            print(f"{'Job Status':<15} {'Count':>10}")
-            print("-" * 60)
-            print(f"{'Total':<15} {summary['total']:>10}")
-            if summary["success"] > 0:
-                print(f"{'Success':<15} {summary['success']:>10}")
-            if summary["failed"] > 0:
-                print(f"{'Failed':<15} {summary['failed']:>10}")
-            if summary["running"] > 0:
-                print(f"{'Running':<15} {summary['running']:>10}")
-            if summary["skipped"] > 0:
-                print(f"{'Skipped':<15} {summary['skipped']:>10}")
-            if summary["pending"] > 0:
-                print(f"{'Pending':<15} {summary['pending']:>10}")
-            print("-" * 60)
+            out.append("-" * 60)
+            out.append(COUNT_ROW_FORMAT("Job Status", "Count"))
+            out.append("-" * 60)
+            out.extend(self._job_count_rows(summary))
+            out.append("-" * 60)
             if summary["failed_jobs"]:
-                print("\nFailed Jobs:")
-                print("-" * 80)
-                print(f"{'ID':<12} {'Stage':<15} {'Name':<50}")
-                print("-" * 80)
+                out.append("\nFailed Jobs:")
+                out.append("-" * 80)
+                out.append(FAILED_JOB_ROW_FORMAT("ID", "Stage", "Name"))
+                out.append("-" * 80)
                 for job in summary["failed_jobs"][:10]:
-                    name = (
-                        job["name"][:47] + "..."
-                        if len(job["name"]) > 50
-                        else job["name"]
+                    out.append(
+                        FAILED_JOB_ROW_FORMAT(
+                            job["id"], job["stage"], truncate(job["name"])
+                        )
                     )
-                    print(f"{job['id']:<12} {job['stage']:<15} {name:<50}")
                 if len(summary["failed_jobs"]) > 10:
-                    print(f"... and {len(summary['failed_jobs']) - 10} more")
+                    out.append(f"... and {len(summary['failed_jobs']) - 10} more")
         else:
             # Friendly summary
-            status_icon = {"success": "✅", "failed": "❌", "running": "🔄"}.get(
-                summary["pipeline_status"], "⏸"
-            )
+            status = summary["pipeline_status"]
+            status_icon, _, _ = STATUS_TABLE.get(status, STATUS_DEFAULT)
 
-            print(
-                f"\nPipeline {pipeline_id}: {status_icon} {summary['pipeline_status'].upper()}"
-            )
-            print(
+            out.append(f"\nPipeline {pipeline_id}: {status_icon} {status.upper()}")
+            out.append(
                 f"Created: {summary['created_at'][:16]} | Duration: {cli.explorer.format_duration(summary['duration'])}"
             )
 
             # Quick stats
-            print(f"Jobs: {summary['total']} total | ", end="")
+            parts = [f"Jobs: {summary['total']} total"]
             if summary["failed"] > 0:
-                print(f"❌ {summary['failed']} failed | ", end="")
+                parts.append(f"❌ {summary['failed']} failed")
             if summary["success"] > 0:
-                print(f"✅ {summary['success']} success | ", end="")
+                parts.append(f"✅ {summary['success']} success")
             if summary["running"] > 0:
-                print(f"🔄 {summary['running']} running | ", end="")
+                parts.append(f"🔄 {summary['running']} running")
             if summary["skipped"] > 0:
-                print(f"⏭ {summary['skipped']} skipped", end="")
-            print()
+                parts.append(f"⏭ {summary['skipped']} skipped")
+            out.append(" | ".join(parts))
             if summary["failed_jobs"]:
-                print("\nFailed Jobs:")
+                out.append("\nFailed Jobs:")
                 for job in summary["failed_jobs"][:5]:
-                    print(f"  ❌ {job['id']} - {job['name']} ({job['stage']})")
+                    out.append(f"  ❌ {job['id']} - {job['name']} ({job['stage']})")
                 if len(summary["failed_jobs"]) > 5:
-                    print(f"  ... and {len(summary['failed_jobs']) - 5} more")
-                print("\n💡 Use --failed to see all failed jobs")
+                    out.append(f"  ... and {len(summary['failed_jobs']) - 5} more")
+                out.append("\n💡 Use --failed to see all failed jobs")
+        self.output_lines(out)
+
+    def _job_count_rows(self, summary):
+        """Total plus each non-zero status count, padded for the statistics table"""
+        rows = [COUNT_ROW_FORMAT("Total", summary["total"])]
+        for label, key in JOB_COUNT_ROWS:
+            if summary[key] > 0:
+                rows.append(COUNT_ROW_FORMAT(label, summary[key]))
+        return rows
+
+    def _stage_rows(self, summary):
+        """(name, status, job count, failed jobs) per stage, built in one pass"""
+        jobs_by_stage = summary["jobs_by_stage"]
+        rows = []
+        for name, counts in summary["stages"].items():
+            status = next((s for s in STAGE_STATUS_ORDER if counts[s]), "pending")
+            failed_jobs = tuple(
+                job for job in jobs_by_stage[name] if job["status"] == "failed"
+            )
+            rows.append((name, status, counts["total"], failed_jobs))
+        return rows
 
     def handle_pipeline_detail(self, cli, pipeline_id, args, output_format):
         try:
-
-            pipeline = cli.explorer.project.pipelines.get(pipeline_id)
-            pipeline_variables = None
-            if getattr(args, "show_variables", False):
-                try:
-                    pipeline_variables = pipeline.variables.list(all=True)
-                except Exception as e:
-                    # Some pipelines might not have variables accessible
-                    if cli.verbose:
-                        print(f"Warning: Could not fetch variables: {e}")
-            summary = cli.explorer.get_job_status_summary(
-                pipeline_id, verbose=cli.verbose
-            )
+            # The job summary doesn't depend on the pipeline object, so fetch
+            # it in the background while the pipeline (and variables) load.
+            # A bad ID is reported once, by the pipeline GET below.
+            with ThreadPoolExecutor(max_workers=1) as ex:
+                summary_future = ex.submit(
+                    cli.explorer.get_job_status_summary,
+                    pipeline_id,
+                    verbose=cli.verbose,
+                    quiet=True,
+                )
+                pipeline = cli.explorer.project.pipelines.get(pipeline_id)
+                pipeline_variables = None
+                if getattr(args, "show_variables", False):
+                    try:
+                        pipeline_variables = pipeline.variables.list(all=True)
+                    except Exception as e:
+                        # Some pipelines might not have variables accessible
+                        if cli.verbose:
+                            print(f"Warning: Could not fetch variables: {e}")
+                summary = summary_future.result()
 
             if output_format == "json":
+                user = getattr(pipeline, "user", None)
+                commit = getattr(pipeline, "commit", None)
                 # Comprehensive JSON output
                 output = {
                     "id": pipeline.id,
-                    "iid": pipeline.iid if hasattr(pipeline, "iid") else None,
+                    "iid": getattr(pipeline, "iid", None),
                     "status": pipeline.status,
                     "ref": pipeline.ref,
                     "sha": pipeline.sha,
@@ -332,34 +405,20 @@ class PipelineCommands(BaseCommand):
                     "started_at": pipeline.started_at,
                     "finished_at": pipeline.finished_at,
                     "duration": pipeline.duration,
-                    "queued_duration": (
-                        pipeline.queued_duration
-                        if hasattr(pipeline, "queued_duration")
-                        else None
-                    ),
-                    "coverage": (
-                        pipeline.coverage if hasattr(pipeline, "coverage") else None
-                    ),
+                    "queued_duration": getattr(pipeline, "queued_duration", None),
+                    "coverage": getattr(pipeline, "coverage", None),
                     "web_url": pipeline.web_url,
                     "user": (
                         {
-                            "username": pipeline.user["username"],
-                            "name": pipeline.user["name"],
+                            "username": user["username"],
+                            "name": user["name"],
                         }
-                        if hasattr(pipeline, "user") and pipeline.user
+                        if user
                         else None
                     ),
                     "commit": {
-                        "message": (
-                            pipeline.commit["message"]
-                            if hasattr(pipeline, "commit")
-                            else None
-                        ),
-                        "author": (
-                            pipeline.commit.get("author_name")
-                            if hasattr(pipeline, "commit")
-                            else None
-                        ),
+                        "message": commit["message"] if commit else None,
+                        "author": commit.get("author_name") if commit else None,
                     },
                     "job_statistics": {
                         "total": summary["total"],
@@ -381,123 +440,102 @@ class PipelineCommands(BaseCommand):
                         for var in pipeline_variables
                     ]
 
-                print(json.dumps(output, indent=2))
+                self.output_json(output)
             elif output_format == "table":
                 # Table format for pipeline details
-                print(f"\nPipeline #{pipeline.id} Details")
-                print("=" * 80)
-                print(f"{'Field':<20} {'Value':<60}")
-                print("-" * 80)
-                print(f"{'Status':<20} {pipeline.status.upper()}")
-                print(f"{'Source':<20} {pipeline.source}")
-                print(f"{'Branch/Tag':<20} {pipeline.ref}")
-                print(f"{'SHA':<20} {pipeline.sha[:8]}")
-                if hasattr(pipeline, "user") and pipeline.user:
-                    print(
-                        f"{'Started by':<20} {pipeline.user['name']} (@{pipeline.user['username']})"
+                out = [f"\nPipeline #{pipeline.id} Details"]
+                out.append("=" * 80)
+                out.append(f"{'Field':<20} {'Value':<60}")
+                out.append("-" * 80)
+                out.append(f"{'Status':<20} {pipeline.status.upper()}")
+                out.append(f"{'Source':<20} {pipeline.source}")
+                out.append(f"{'Branch/Tag':<20} {pipeline.ref}")
+                out.append(f"{'SHA':<20} {pipeline.sha[:8]}")
+                user = getattr(pipeline, "user", None)
+                if user:
+                    out.append(
+                        f"{'Started by':<20} {user['name']} (@{user['username']})"
                     )
-                print(f"{'Created':<20} {pipeline.created_at}")
-                print(f"{'Started':<20} {pipeline.started_at or 'Not started'}")
-                print(f"{'Finished':<20} {pipeline.finished_at or 'Still running'}")
-                print(
+                out.append(f"{'Created':<20} {pipeline.created_at}")
+                out.append(f"{'Started':<20} {pipeline.started_at or 'Not started'}")
+                out.append(
+                    f"{'Finished':<20} {pipeline.finished_at or 'Still running'}"
+                )
+                out.append(
                     f"{'Duration':<20} {cli.explorer.format_duration(pipeline.duration)}"
                 )
-                if hasattr(pipeline, "queued_duration") and pipeline.queued_duration:
-                    print(
-                        f"{'Queued':<20} {cli.explorer.format_duration(pipeline.queued_duration)}"
-                    )
-                print("-" * 80)
-                print(f"\nJob Statistics:")
-                print("-" * 40)
-                print(f"{'Status':<15} {'Count':>10}")
-                print("-" * 40)
-                print(f"{'Total':<15} {summary['total']:>10}")
-                if summary["success"] > 0:
-                    print(f"{'Success':<15} {summary['success']:>10}")
-                if summary["failed"] > 0:
-                    print(f"{'Failed':<15} {summary['failed']:>10}")
-                if summary["running"] > 0:
-                    print(f"{'Running':<15} {summary['running']:>10}")
-                if summary["skipped"] > 0:
-                    print(f"{'Skipped':<15} {summary['skipped']:>10}")
-                if summary["pending"] > 0:
-                    print(f"{'Pending':<15} {summary['pending']:>10}")
-                print("-" * 40)
-                print(f"\nURL: {pipeline.web_url}")
+                queued = getattr(pipeline, "queued_duration", None)
+                if queued:
+                    out.append(f"{'Queued':<20} {cli.explorer.format_duration(queued)}")
+                out.append("-" * 80)
+                out.append(f"\nJob Statistics:")
+                out.append("-" * 40)
+                out.append(COUNT_ROW_FORMAT("Status", "Count"))
+                out.append("-" * 40)
+                out.extend(self._job_count_rows(summary))
+                out.append("-" * 40)
+                out.append(f"\nURL: {pipeline.web_url}")
+                self.output_lines(out)
             else:
                 # Friendly detailed output
-                status_icon = {
-                    "success": "✅",
-                    "failed": "❌",
-                    "running": "🔄",
-                    "canceled": "⏹",
-                    "skipped": "⏭",
-                }.get(pipeline.status, "⏸")
-
-                print(f"\n{'='*60}")
-                print(f"Pipeline #{pipeline.id}")
-                print(f"{'='*60}\n")
-
-                print(f"Status:       {status_icon} {pipeline.status.upper()}")
-                print(f"Source:       {pipeline.source}")
-                print(f"Branch/Tag:   {pipeline.ref}")
-
-                if hasattr(pipeline, "user") and pipeline.user:
-                    print(
-                        f"Started by:   {pipeline.user['name']} (@{pipeline.user['username']})"
-                    )
-
-                print(f"\nTiming:")
-                print(f"  Created:    {pipeline.created_at}")
-                print(f"  Started:    {pipeline.started_at or 'Not started'}")
-                print(f"  Finished:   {pipeline.finished_at or 'Still running'}")
-                print(
+                status = pipeline.status
+                status_line = STATUS_LINES.get(status) or f"⏸ {status.upper()}"
+
+                # Unconditional lines are grouped into one multi-line entry each
+                out = [
+                    "\n" + "=" * 60,
+                    f"Pipeline #{pipeline.id}",
+                    "=" * 60 + "\n",
+                    f"Status:       {status_line}\n"
+                    f"Source:       {pipeline.source}\n"
+                    f"Branch/Tag:   {pipeline.ref}",
+                ]
+
+                user = getattr(pipeline, "user", None)
+                if user:
+                    out.append(f"Started by:   {user['name']} (@{user['username']})")
+
+                out.append(
+                    "\nTiming:\n"
+                    f"  Created:    {pipeline.created_at}\n"
+                    f"  Started:    {pipeline.started_at or 'Not started'}\n"
+                    f"  Finished:   {pipeline.finished_at or 'Still running'}\n"
                     f"  Duration:   {cli.explorer.format_duration(pipeline.duration)}"
                 )
-                if hasattr(pipeline, "queued_duration") and pipeline.queued_duration:
-                    print(
-                        f"  Queued:     {cli.explorer.format_duration(pipeline.queued_duration)}"
-                    )
-
-                print(f"\nCommit:")
-                print(f"  SHA:        {pipeline.sha[:8]}")
-                if hasattr(pipeline, "commit") and pipeline.commit:
-                    commit_msg = pipeline.commit["message"].split("\\n")[0][:60]
-                    print(f"  Message:    {commit_msg}")
-                    if "author_name" in pipeline.commit:
-                        print(f"  Author:     {pipeline.commit['author_name']}")
-
-                print(f"\nJob Statistics:")
-                print(f"  Total:      {summary['total']} jobs")
+                queued = getattr(pipeline, "queued_duration", None)
+                if queued:
+                    out.append(f"  Queued:     {cli.explorer.format_duration(queued)}")
+
+                out.append(f"\nCommit:\n  SHA:        {pipeline.sha[:8]}")
+                commit = getattr(pipeline, "commit", None)
+                if commit:
+                    commit_msg = commit["message"].split("\\n")[0][:60]
+                    out.append(f"  Message:    {commit_msg}")
+                    if "author_name" in commit:
+                        out.append(f"  Author:     {commit['author_name']}")
+
+                out.append(f"\nJob Statistics:\n  Total:      {summary['total']} jobs")
                 if summary["failed"] > 0:
-                    print(f"  Failed:     ❌ {summary['failed']}")
+                    out.append(f"  Failed:     ❌ {summary['failed']}")
                 if summary["success"] > 0:
-                    print(f"  Success:    ✅ {summary['success']}")
+                    out.append(f"  Success:    ✅ {summary['success']}")
                 if summary["running"] > 0:
-                    print(f"  Running:    🔄 {summary['running']}")
+                    out.append(f"  Running:    🔄 {summary['running']}")
                 if summary["skipped"] > 0:
-                    print(f"  Skipped:    ⏭ {summary['skipped']}")
+                    out.append(f"  Skipped:    ⏭ {summary['skipped']}")
                 if summary["pending"] > 0:
-                    print(f"  Pending:    ⏸ {summary['pending']}")
+                    out.append(f"  Pending:    ⏸ {summary['pending']}")
                 if summary["stages"]:
-                    print(f"\nStages:")
-                    for stage_name, stage_info in summary["stages"].items():
-                        stage_icon = {
-                            "success": "✅",
-                            "failed": "❌",
-                            "running": "🔄",
-                            "skipped": "⏭",
-                        }.get(stage_info["status"], "⏸")
-                        print(
-                            f"  {stage_icon} {stage_name}: {stage_info['count']} jobs"
-                        )
-                        if stage_info["failed_jobs"]:
-                            for job in stage_info["failed_jobs"][:3]:
-                                print(f"      ❌ {job['id']} - {job['name']}")
+                    out.append(f"\nStages:")
+                    for name, status, count, failed_jobs in self._stage_rows(summary):
+                        stage_icon = STATUS_TABLE.get(status, STATUS_DEFAULT)[0]
+                        out.append(f"  {stage_icon} {name}: {count} jobs")
+                        for job in failed_jobs[:3]:
+                            out.append(f"      ❌ {job['id']} - {job['name']}")
                 if pipeline_variables is not None and len(pipeline_variables) > 0:
-                    print(f"\n{'='*60}")
-                    print("Pipeline Variables:")
-                    print(f"{'='*60}")
+                    out.append("\n" + "=" * 60)
+                    out.append("Pipeline Variables:")
+                    out.append("=" * 60)
 
                     # Group variables by type
                     env_vars = []
@@ -511,7 +549,7 @@ class PipelineCommands(BaseCommand):
                             env_vars.append(var)
 
                     if env_vars:
-                        print("\nEnvironment Variables:")
+                        out.append("\nEnvironment Variables:")
                         for var in env_vars:
                             # Mask sensitive values (show first and last 2 chars if long enough)
                             value = var.value
@@ -526,76 +564,64 @@ class PipelineCommands(BaseCommand):
                             else:
                                 masked_value = "*" * len(value)
 
-                            print(f"  {var.key}: {masked_value}")
+                            out.append(f"  {var.key}: {masked_value}")
 
                     if file_vars:
-                        print("\nFile Variables:")
+                        out.append("\nFile Variables:")
                         for var in file_vars:
-                            print(
+                            out.append(
                                 f"  {var.key}: [File content, {len(var.value)} bytes]"
                             )
 
-                    print(f"\nTotal variables: {len(pipeline_variables)}")
+                    out.append(f"\nTotal variables: {len(pipeline_variables)}")
                 elif getattr(args, "show_variables", False):
-                    print("\nNo pipeline variables found or accessible.")
+                    out.append("\nNo pipeline variables found or accessible.")
 
-                print(f"\nPIPELINE_URL: {pipeline.web_url}")
-                print(f"PIPELINE_ID: {pipeline.id}")
+                out.append(f"\nPIPELINE_URL: {pipeline.web_url}")
+                out.append(f"PIPELINE_ID: {pipeline.id}")
+                self.output_lines(out)
 
         except Exception as e:
             print(f"Error fetching pipeline {pipeline_id} details: {e}")
 
     def handle_pipeline_retry(self, cli, pipeline_id, args, output_format):
         try:
-            pipeline = cli.explorer.project.pipelines.get(pipeline_id)
-
+            # lazy=True skips the GET; the retry POST returns the pipeline
+            pipeline = cli.explorer.project.pipelines.get(pipeline_id, lazy=True)
             result = pipeline.retry()
+            if not isinstance(result, dict):
+                result = {}
+            new_id = result.get("id", pipeline_id)
+            new_status = result.get("status", "pending")
 
             if output_format == "json":
-                print(
-                    json.dumps(
-                        {
-                            "action": "retry",
-                            "pipeline_id": pipeline_id,
-                            "status": "success",
-                            "new_pipeline": {
-                                "id": (
-                                    result.id if hasattr(result, "id") else pipeline_id
-                                ),
-                                "status": (
-                                    result.status
-                                    if hasattr(result, "status")
-                                    else "pending"
-                                ),
-                            },
-                        },
-                        indent=2,
-                    )
+                self.output_json(
+                    {
+                        "action": "retry",
+                        "pipeline_id": pipeline_id,
+                        "status": "success",
+                        "new_pipeline": {"id": new_id, "status": new_status},
+                    }
                 )
             else:
                 print(f"✅ Pipeline #{pipeline_id} retry initiated")
-                if hasattr(result, "id"):
-                    print(f"New pipeline: #{result.id}")
-                print(
-                    f"Status: {result.status if hasattr(result, 'status') else 'pending'}"
-                )
+                if new_id != pipeline_id:
+                    print(f"New pipeline: #{new_id}")
+                print(f"Status: {new_status}")
 
         except Exception as e:
             if output_format == "json":
-                print(
-                    json.dumps(
-                        {
-                            "action": "retry",
-                            "pipeline_id": pipeline_id,
-                            "status": "error",
-                            "error": str(e),
-                        },
-                        indent=2,
-                    )
+                self.output_json(
+                    {
+                        "action": "retry",
+                        "pipeline_id": pipeline_id,
+                        "status": "error",
+                        "error": str(e),
+                    }
                 )
             else:
                 print(f"❌ Error retrying pipeline {pipeline_id}: {e}")
-            sys.exit(1)
+            exit_now(1)
 
     def handle_pipeline_rerun(self, cli, pipeline_id, args, output_format):
         try:
@@ -609,19 +635,16 @@ class PipelineCommands(BaseCommand):
             )
 
             if output_format == "json":
-                print(
-                    json.dumps(
-                        {
-                            "action": "rerun",
-                            "original_pipeline_id": pipeline_id,
-                            "new_pipeline_id": new_pipeline.id,
-                            "status": "success",
-                            "ref": new_pipeline.ref,
-                            "sha": new_pipeline.sha,
-                            "web_url": new_pipeline.web_url,
-                        },
-                        indent=2,
-                    )
+                self.output_json(
+                    {
+                        "action": "rerun",
+                        "original_pipeline_id": pipeline_id,
+                        "new_pipeline_id": new_pipeline.id,
+                        "status": "success",
+                        "ref": new_pipeline.ref,
+                        "sha": new_pipeline.sha,
+                        "web_url": new_pipeline.web_url,
+                    }
                 )
             else:
                 print(f"✅ New pipeline created for same commit")
@@ -634,16 +657,13 @@ class PipelineCommands(BaseCommand):
 
         except Exception as e:
             if output_format == "json":
-                print(
-                    json.dumps(
-                        {
-                            "action": "rerun",
-                            "pipeline_id": pipeline_id,
-                            "status": "error",
-                            "error": str(e),
-                        },
-                        indent=2,
-                    )
+                self.output_json(
+                    {
+                        "action": "rerun",
+                        "pipeline_id": pipeline_id,
+                        "status": "error",
+                        "error": str(e),
+                    }
                 )
             else:
                 print(f"❌ Error creating new pipeline for #{pipeline_id}: {e}")
@@ -651,64 +671,56 @@ class PipelineCommands(BaseCommand):
 
     def handle_pipeline_cancel(self, cli, pipeline_id, args, output_format):
         try:
+            # The cancel POST answers 200 with a canceled pipeline whether
+            # or not it was running, so check the status before sending it
             pipeline = cli.explorer.project.pipelines.get(pipeline_id)
-            if pipeline.status in ["success", "failed", "canceled", "skipped"]:
+            if pipeline.status in FINISHED_STATUSES:
                 if output_format == "json":
-                    print(
-                        json.dumps(
-                            {
-                                "action": "cancel",
-                                "pipeline_id": pipeline_id,
-                                "status": "error",
-                                "error": f"Pipeline is already {pipeline.status}",
-                            },
-                            indent=2,
-                        )
+                    self.output_json(
+                        {
+                            "action": "cancel",
+                            "pipeline_id": pipeline_id,
+                            "status": "error",
+                            "error": f"Pipeline is already {pipeline.status}",
+                        }
                     )
                 else:
                     print(f"⚠️  Pipeline #{pipeline_id} is already {pipeline.status}")
                 return
 
             result = pipeline.cancel()
+            status = (
+                result.get("status", "canceled")
+                if isinstance(result, dict)
+                else "canceled"
+            )
 
             if output_format == "json":
-                print(
-                    json.dumps(
-                        {
-                            "action": "cancel",
-                            "pipeline_id": pipeline_id,
-                            "status": "success",
-                            "pipeline_status": (
-                                result.status
-                                if hasattr(result, "status")
-                                else "canceled"
-                            ),
-                        },
-                        indent=2,
-                    )
+                self.output_json(
+                    {
+                        "action": "cancel",
+                        "pipeline_id": pipeline_id,
+                        "status": "success",
+                        "pipeline_status": status,
+                    }
                 )
             else:
                 print(f"✅ Pipeline #{pipeline_id} canceled")
-                print(
-                    f"Status: {result.status if hasattr(result, 'status') else 'canceled'}"
-                )
+                print(f"Status: {status}")
 
         except Exception as e:
             if output_format == "json":
-                print(
-                    json.dumps(
-                        {
-                            "action": "cancel",
-                            "pipeline_id": pipeline_id,
-                            "status": "error",
-                            "error": str(e),
-                        },
-                        indent=2,
-                    )
+                self.output_json(
+                    {
+                        "action": "cancel",
+                        "pipeline_id": pipeline_id,
+                        "status": "error",
+                        "error": str(e),
+                    }
                 )
             else:
                 print(f"❌ Error canceling pipeline {pipeline_id}: {e}")
-            sys.exit(1)
+            exit_now(1)
 
     def handle_pipeline_graph(self, cli, pipeline_id, args, output_format):
         try:
@@ -744,15 +756,15 @@ class PipelineCommands(BaseCommand):
                             }
                         )
                     graph_data["stages"].append({"name": stage, "jobs": stage_jobs})
-                print(json.dumps(graph_data, indent=2))
+                self.output_json(graph_data)
             else:
                 # ASCII graph visualization
-                print(f"\n{'='*80}")
+                print("\n" + "=" * 80)
                 print(f"Pipeline #{pipeline_id} Graph")
                 print(
                     f"Status: {self._get_status_icon(pipeline.status)} {pipeline.status}"
                 )
-                print(f"{'='*80}\n")
+                print("=" * 80 + "\n")
                 stage_line = " → ".join(stage_order)
                 print(f"Stage Flow: {stage_line}\n")
                 print("-" * 80)
@@ -793,28 +805,17 @@ class PipelineCommands(BaseCommand):
                 # Test duration graph for parallel jobs
                 self._display_test_duration_graph(stages, stage_order)
 
-                print(f"\n{'='*80}")
+                print("\n" + "=" * 80)
 
         except Exception as e:
             if output_format == "json":
-                print(
-                    json.dumps({"error": str(e), "pipeline_id": pipeline_id}, indent=2)
-                )
+                self.output_json({"error": str(e), "pipeline_id": pipeline_id})
             else:
                 print(f"❌ Error generating pipeline graph: {e}")
             sys.exit(1)
 
     def _get_status_icon(self, status):
-        return {
-            "success": "[SUCCESS]",
-            "failed": "[FAILED]",
-            "running": "[RUNNING]",
-            "pending": "[PENDING]",
-            "canceled": "[CANCELED]",
-            "skipped": "[SKIPPED]",
-            "manual": "[MANUAL]",
-            "created": "[CREATED]",
-        }.get(status, "[UNKNOWN]")
+        return STATUS_LABELS.get(status, "[UNKNOWN]")
 
     def handle_pipeline_follow(self, cli, pipeline_id, args, output_format):
         try:
@@ -891,7 +892,7 @@ class PipelineCommands(BaseCommand):
                             except:
                                 print("  (Unable to fetch job logs)")
                     if pipeline.status in completed_statuses:
-                        print(f"\n{'='*80}")
+                        print("\n" + "=" * 80)
                         print(
                             f"Pipeline completed with status: {pipeline.status.upper()}"
                         )
@@ -960,9 +961,9 @@ class PipelineCommands(BaseCommand):
             return
         parallel_jobs.sort(key=lambda x: x["num"])
 
-        print(f"\n{'='*80}")
+        print("\n" + "=" * 80)
         print("Parallel Test Duration Graph")
-        print(f"{'='*80}")
+        print("=" * 80)
 
         # Find max duration for scaling
         max_duration = max(job["duration"] for job in parallel_jobs)
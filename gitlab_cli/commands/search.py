@@ -4,9 +4,19 @@
 
 """Search and filter commands for pipelines and MRs"""
 
-import json
 from datetime import datetime, timedelta
-from .base import BaseCommand
+from .base import (
+    BaseCommand,
+    MR_STATE_DEFAULT,
+    MR_STATE_TABLE,
+    STATUS_DEFAULT,
+    STATUS_TABLE,
+    truncate,
+)
+
+# Row layouts of the pipeline and MR result tables
+PIPELINE_RESULT_ROW_FORMAT = "{:<10} {:<10} {:<10} {:<25} {:<15} {:<20}".format
+MR_RESULT_ROW_FORMAT = "{:<8} {:<10} {:<15} {:<40} {:<30}".format
 
 
 class SearchCommand(BaseCommand):
@@ -97,9 +107,10 @@ class SearchCommand(BaseCommand):
             filtered_pipelines = []
             for p in pipelines:
                 # Skip pipelines created by GitLab Security Policy Bot
-                if hasattr(p, "user") and p.user:
-                    username = p.user.get("username", "")
-                    name = p.user.get("name", "")
+                user = getattr(p, "user", None)
+                if user:
+                    username = user.get("username", "")
+                    name = user.get("name", "")
                     if (
                         "security-policy-bot" in username.lower()
                         or "security policy bot" in name.lower()
@@ -169,36 +180,33 @@ class SearchCommand(BaseCommand):
                             "sha": p.sha[:8],
                             "source": p.source,
                             "created_at": p.created_at,
-                            "user": (
-                                p.user.get("username")
-                                if hasattr(p, "user") and p.user
-                                else None
-                            ),
+                            "user": (getattr(p, "user", None) or {}).get("username"),
                             "web_url": p.web_url,
                         }
                         for p in pipelines
                     ]
                 }
-                print(json.dumps(output, indent=2))
+                self.output_json(output)
             elif output_format == "table":
                 print(f"\nPipelines (showing {len(pipelines)} results)")
                 print("=" * 120)
                 print(
-                    f"{'ID':<10} {'Status':<10} {'Source':<10} {'Branch/Tag':<25} {'User':<15} {'Created':<20}"
+                    PIPELINE_RESULT_ROW_FORMAT(
+                        "ID", "Status", "Source", "Branch/Tag", "User", "Created"
+                    )
                 )
                 print("-" * 120)
 
                 for p in pipelines:
-                    ref_display = p.ref[:22] + "..." if len(p.ref) > 25 else p.ref
-                    user_display = (
-                        p.user.get("username", "N/A")[:15]
-                        if hasattr(p, "user") and p.user
-                        else "N/A"
-                    )
+                    ref_display = truncate(p.ref, 25)
+                    user = getattr(p, "user", None) or {}
+                    user_display = user.get("username", "N/A")[:15]
                     created = p.created_at[:19].replace("T", " ")
 
                     print(
-                        f"{p.id:<10} {p.status:<10} {p.source:<10} {ref_display:<25} {user_display:<15} {created:<20}"
+                        PIPELINE_RESULT_ROW_FORMAT(
+                            p.id, p.status, p.source, ref_display, user_display, created
+                        )
                     )
                 print("\nPIPELINE_IDS: " + ",".join(str(p.id) for p in pipelines))
             else:
@@ -207,18 +215,12 @@ class SearchCommand(BaseCommand):
                 print("-" * 60)
 
                 for p in pipelines:
-                    status_icon = {
-                        "success": "✅",
-                        "failed": "❌",
-                        "running": "🔄",
-                        "pending": "⏳",
-                        "canceled": "🚫",
-                        "skipped": "⏭",
-                    }.get(p.status, "❓")
+                    status_icon = STATUS_TABLE.get(p.status, STATUS_DEFAULT)[0]
                     user_str = ""
-                    if hasattr(p, "user") and p.user:
-                        username = p.user.get("username", "unknown")
-                        name = p.user.get("name", "")
+                    user = getattr(p, "user", None)
+                    if user:
+                        username = user.get("username", "unknown")
+                        name = user.get("name", "")
                         if name and name != username:
                             user_str = f"@{username} ({name})"
                         else:
@@ -345,23 +347,29 @@ class SearchCommand(BaseCommand):
                         for mr in mrs
                     ]
                 }
-                print(json.dumps(output, indent=2))
+                self.output_json(output)
             elif output_format == "table":
                 print(f"\nMerge Requests (showing {len(mrs)} results)")
                 print("=" * 120)
                 print(
-                    f"{'MR':<8} {'State':<10} {'Author':<15} {'Title':<40} {'Source → Target':<30}"
+                    MR_RESULT_ROW_FORMAT(
+                        "MR", "State", "Author", "Title", "Source → Target"
+                    )
                 )
                 print("-" * 120)
 
                 for mr in mrs:
-                    title_display = (
-                        mr.title[:37] + "..." if len(mr.title) > 40 else mr.title
-                    )
+                    title_display = truncate(mr.title, 40)
                     branches = f"{mr.source_branch[:13]} → {mr.target_branch[:13]}"
 
                     print(
-                        f"!{mr.iid:<7} {mr.state:<10} {mr.author['username']:<15} {title_display:<40} {branches:<30}"
+                        MR_RESULT_ROW_FORMAT(
+                            f"!{mr.iid}",
+                            mr.state,
+                            mr.author["username"],
+                            title_display,
+                            branches,
+                        )
                     )
                 print("\nMR_IIDS: " + ",".join(str(mr.iid) for mr in mrs))
             else:
@@ -370,12 +378,7 @@ class SearchCommand(BaseCommand):
                 print("-" * 60)
 
                 for mr in mrs:
-                    state_icon = {
-                        "opened": "📂",
-                        "closed": "📕",
-                        "merged": "✅",
-                        "locked": "🔒",
-                    }.get(mr.state, "❓")
+                    state_icon = MR_STATE_TABLE.get(mr.state, MR_STATE_DEFAULT)[0]
 
                     draft_str = (
                         " 📝 DRAFT"
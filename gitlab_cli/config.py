@@ -7,7 +7,7 @@ import json
 import subprocess
 import re
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 
 class Config:
@@ -138,7 +138,7 @@ class Config:
     def diff_view(self) -> str:
         return self._config.get('diff_view', 'unified')
     
-    def validate(self) -> tuple[bool, str]:
+    def validate(self) -> Tuple[bool, str]:
         """Validate required configuration"""
         if not self.gitlab_url:
             return False, "GITLAB_URL not set. Set via environment variable or run: gitlab-cli config --gitlab-url <url>"
@@ -32,8 +32,11 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=[
-        "python-gitlab>=3.0.0",
+        "python-gitlab>=3.7.0",
     ],
+    extras_require={
+        "fast": ["orjson>=3.0"],
+    },
     entry_points={
         "console_scripts": [
             "gitlab-cli=gitlab_cli.cli_v3:main",
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+
+# Copyright 2024 BeardedGiant
+# https://github.com/bearded-giant/gitlab-tools
+# Licensed under Apache License 2.0
+
+"""Test current branch detection from .git/HEAD and its git fallback"""
+
+import os
+import subprocess
+import sys
+import tempfile
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from gitlab_cli.commands.base import _current_branch
+
+
+def current_branch(head, git_output=""):
+    """(branch, whether git was asked) in a scratch repo with HEAD `head`"""
+    repo = tempfile.mkdtemp()
+    os.mkdir(os.path.join(repo, ".git"))
+    with open(os.path.join(repo, ".git", "HEAD"), "w") as f:
+        f.write(head + "\n")
+
+    git = mock.Mock(return_value=subprocess.CompletedProcess([], 0, stdout=git_output))
+    cwd = os.getcwd()
+    os.chdir(repo)
+    try:
+        with mock.patch.dict(os.environ), mock.patch("subprocess.run", git):
+            os.environ.pop("GIT_DIR", None)
+            _current_branch.cache_clear()
+            return _current_branch(), git.called
+    finally:
+        _current_branch.cache_clear()
+        os.chdir(cwd)
+
+
+def test_branch_read_from_head_file():
+    assert current_branch("ref: refs/heads/feature/x") == ("feature/x", False)
+
+
+def test_detached_head_is_none_without_asking_git():
+    head = "0123456789abcdef0123456789abcdef01234567"
+    assert current_branch(head, git_output="main\n") == (None, False)
+
+
+def test_reftable_placeholder_falls_back_to_git():
+    assert current_branch("ref: refs/heads/.invalid", git_output="main\n") == (
+        "main",
+        True,
+    )
+
+
+def test_reftable_detached_head_is_none():
+    assert current_branch("ref: refs/heads/.invalid", git_output="\n") == (
+        None,
+        True,
+    )
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"✓ {name}")
+    print("\nCurrent branch detection works!")
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+
+# Copyright 2024 BeardedGiant
+# https://github.com/bearded-giant/gitlab-tools
+# Licensed under Apache License 2.0
+
+"""Test ID list parsing shared by the job, pipeline and MR commands"""
+
+import contextlib
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from gitlab_cli.commands.base import BaseCommand
+
+
+def parse_error(id_string):
+    """Return (exit code, printed message) for input parse_ids rejects"""
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        try:
+            BaseCommand().parse_ids(id_string)
+        except SystemExit as e:
+            return e.code, out.getvalue()
+    raise AssertionError(f"{id_string!r} was accepted")
+
+
+def test_single_id():
+    assert BaseCommand().parse_ids("42") == [42]
+
+
+def test_repeated_ids_keep_first_seen_order():
+    assert BaseCommand().parse_ids("3, 1,3") == [3, 1]
+    assert BaseCommand().parse_ids("5,5,5") == [5]
+
+
+def test_reports_first_invalid_part():
+    assert parse_error("1,x") == (1, "Invalid ID: x\n")
+    assert parse_error("1,x,y") == (1, "Invalid ID: x\n")
+    assert parse_error("1,,2") == (1, "Invalid ID: \n")
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"✓ {name}")
+    print("\nID lists parse correctly!")
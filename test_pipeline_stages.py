@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+
+# Copyright 2024 BeardedGiant
+# https://github.com/bearded-giant/gitlab-tools
+# Licensed under Apache License 2.0
+
+"""Test the per-stage rows shown by the pipeline detail view"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from gitlab_cli.cli import GitLabExplorer
+from gitlab_cli.commands.pipelines import PipelineCommands
+
+
+def job(job_id, stage, status, name=None):
+    return {
+        "id": job_id,
+        "name": name or f"job-{job_id}",
+        "stage": stage,
+        "status": status,
+        "duration": 12.0,
+    }
+
+
+def summarize(jobs):
+    """get_job_status_summary over canned pipeline details, no GitLab needed"""
+    explorer = GitLabExplorer.__new__(GitLabExplorer)
+    explorer.get_pipeline_details = lambda pipeline_id, verbose=False, quiet=False: {
+        "pipeline": {"status": "failed", "created_at": "2024-05-01T10:00:00Z"},
+        "jobs": jobs,
+    }
+    return explorer.get_job_status_summary(1)
+
+
+def test_stage_rows_for_stages_named_by_the_jobs():
+    summary = summarize(
+        [
+            job(1, "build", "success"),
+            job(2, "deploy-canary", "failed", "canary"),
+            job(3, "deploy-canary", "success"),
+            job(4, "post-deploy", "created"),
+        ]
+    )
+
+    rows = PipelineCommands()._stage_rows(summary)
+
+    assert [row[:3] for row in rows] == [
+        ("build", "success", 1),
+        ("deploy-canary", "failed", 2),
+        # No counted status at all falls back to pending
+        ("post-deploy", "pending", 1),
+    ]
+    canary_failures = rows[1][3]
+    assert [(j["id"], j["name"]) for j in canary_failures] == [(2, "canary")]
+    assert rows[0][3] == () and rows[2][3] == ()
+
+
+def test_stage_rows_empty_pipeline():
+    assert PipelineCommands()._stage_rows(summarize([])) == []
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"✓ {name}")
+    print("\nPipeline stage rows build correctly!")
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+
+# Copyright 2024 BeardedGiant
+# https://github.com/bearded-giant/gitlab-tools
+# Licensed under Apache License 2.0
+
+"""Test the short-lived API response cache in the pipelines cache database"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from gitlab_cli.cli import GitLabExplorer
+
+
+def make_explorer(db_file, project_id=1):
+    """An explorer on a scratch cache file, without connecting to GitLab"""
+    explorer = GitLabExplorer.__new__(GitLabExplorer)
+    explorer.db_file = db_file
+    explorer.project = SimpleNamespace(id=project_id)
+    explorer.init_db()
+    return explorer
+
+
+class Loader:
+    """Counts how often the cache had to fall through to the API"""
+
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+def scratch_db():
+    return os.path.join(tempfile.mkdtemp(), "pipelines_cache.db")
+
+
+def test_hit_reuses_response():
+    explorer = make_explorer(scratch_db())
+    load = Loader({"id": 7, "status": "failed"})
+
+    assert explorer.cached_response("job", 7, load) == {"id": 7, "status": "failed"}
+    assert explorer.cached_response("job", 7, load) == {"id": 7, "status": "failed"}
+    assert load.calls == 1
+
+
+def test_no_cache_bypasses_response():
+    explorer = make_explorer(scratch_db())
+    load = Loader([1, 2])
+
+    explorer.cached_response("job", 7, load)
+    explorer.cached_response("job", 7, load, use_cache=False)
+    assert load.calls == 2
+
+
+def test_expired_response_is_refetched_and_pruned():
+    explorer = make_explorer(scratch_db())
+    load = Loader({"id": 7})
+    now = time.time()
+
+    with mock.patch("time.time", return_value=now):
+        explorer.cached_response("job", 7, load, ttl=5)
+        explorer.cached_response("job", 8, load, ttl=5)
+    with mock.patch("time.time", return_value=now + 4):
+        explorer.cached_response("job", 7, load, ttl=5)
+    assert load.calls == 2
+
+    with mock.patch("time.time", return_value=now + 6):
+        explorer.cached_response("job", 7, load, ttl=5)
+    assert load.calls == 3
+
+    # Writing the fresh job 7 row dropped the expired job 8 row
+    conn = sqlite3.connect(explorer.db_file)
+    rows = conn.execute("SELECT object_id FROM responses").fetchall()
+    conn.close()
+    assert rows == [("1:7",)]
+
+
+def test_invalidate_drops_response():
+    explorer = make_explorer(scratch_db())
+    load = Loader({"id": 7})
+
+    explorer.cached_response("job", 7, load)
+    explorer.invalidate_response("job", 7)
+    explorer.cached_response("job", 7, load)
+    assert load.calls == 2
+
+
+def test_responses_are_scoped_to_the_project():
+    db_file = scratch_db()
+    first = make_explorer(db_file, project_id=1)
+    second = make_explorer(db_file, project_id=2)
+
+    assert first.cached_response("mr", 3, Loader({"title": "one"})) == {"title": "one"}
+    assert second.cached_response("mr", 3, Loader({"title": "two"})) == {"title": "two"}
+    assert first.cached_response("mr", 3, Loader(None)) == {"title": "one"}
+
+    # Invalidating in one project leaves the other's entry alone
+    second.invalidate_response("mr", 3)
+    load = Loader({"title": "one again"})
+    first.cached_response("mr", 3, load)
+    assert load.calls == 0
+
+
+def test_branch_mrs_are_keyed_by_project_branch_and_state():
+    db_file = scratch_db()
+    first = make_explorer(db_file, project_id=1)
+    second = make_explorer(db_file, project_id=2)
+    first._list_mrs_for_branch = lambda branch, state: [{"project": 1, "state": state}]
+    second._list_mrs_for_branch = lambda branch, state: [{"project": 2, "state": state}]
+
+    assert first.get_mrs_for_branch("main", "all", True) == [
+        {"project": 1, "state": "all"}
+    ]
+    assert second.get_mrs_for_branch("main", "all", True) == [
+        {"project": 2, "state": "all"}
+    ]
+    assert first.get_mrs_for_branch("main", "opened", True) == [
+        {"project": 1, "state": "opened"}
+    ]
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"✓ {name}")
+    print("\nResponse cache behaves as expected!")